@@ -10,11 +10,17 @@ Developed with ❤️ by @RBerga06, Physics student @ UniPR (Parma, Italy).\
 from ._tensor_numpy import *
 
 # Core data structures & utilities
+from .range import *
 from .measure import *
 from .data import *
 from .bins import *
 from .distribution import *
 from .dataset import *
+from .streaming import *
+from .dual import *
+from .correlated import *
+from .graph import *
+from .curvefit import *
 
 # Distributions
 from .normal import *
@@ -23,3 +29,6 @@ from .bernoulli import *
 
 # Constants
 from .constants import *
+
+# Don't shadow the `range` builtin on `from rberga06.phylab import *`
+__all__ = [name for name in globals() if not name.startswith("_") and name != "range"]  # pyright: ignore[reportUnsupportedDunderAll]
@@ -92,6 +92,13 @@ class Simd(Generic[_T_co, *_S]):
         """Reinterpret the last axis as a vector."""
         ...
 
+    @property
+    def as_simd_mat[X: Elem, N: int, M: int](
+        self: "Simd[X, *_S, N, M]", /
+    ) -> "Simd[Mat[N, M, X], *_S]":
+        """Reinterpret the last two axes as a matrix."""
+        ...
+
     @property
     def as_vec_simd[X: Elem, N: int](
         self: "Simd[X, N, *_S]", /
@@ -207,3 +214,9 @@ class Mat(Generic[_N_co, _M_co, _T_co]):
     def mat_log[N: int](self: "Mat[N, N, _T_co]", /) -> "Mat[N, N, _T_co]":
         """Evaluate the (matrix) natural logarithm of this (square) matrix."""
         ...
+
+    def mat_exp_grid[N: int, K: int](
+        self: "Mat[N, N, _T_co]", ts: "Vec[K, float]", /
+    ) -> "Simd[Mat[N, N, _T_co], K]":
+        """Evaluate `exp(self * t)` for each `t` in `ts` (e.g. the propagator of `dx/dt = self @ x`)."""
+        ...
@@ -1,15 +1,34 @@
 # Implementation of the `_tensor.pyi` API baked buy numpy.
 # pyright: reportAny = false
 from dataclasses import dataclass
+from typing import Any
 from typing_extensions import TypeVar, TypeVarTuple, Generic, Self, final, overload
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 import numpy as np
 
 type Elem = (
-    # Simd[Elem, *tuple[Any, ...]] |  # TODO
+    Simd[Elem, *tuple[Any, ...]] |
     # Mat[int, int, Elem] | Vec[int, Elem] |  # TODO
     bool | int | float
 )
+type _Native = np.bool_ | np.int64 | np.float64 | np.complex128
+"""The dtypes we store elements as."""
+
+
+def _native(it: Iterable[Any], /, *, copy: bool = False) -> np.ndarray[Any, Any]:
+    """Convert `it` to an array with a native dtype (without copying, if it already is one and not `copy`)."""
+    a = np.asarray(it if isinstance(it, np.ndarray | Sequence) else list(it))
+    match a.dtype.kind:
+        case "b":
+            return a.astype(np.bool_, copy=copy)
+        case "i" | "u":
+            return a.astype(np.int64, copy=copy)
+        case "c":
+            return a.astype(np.complex128, copy=copy)
+        case _:
+            return a.astype(np.float64, copy=copy)
+
+
 _N_co = TypeVar("_N_co", bound=int, covariant=True)
 _M_co = TypeVar("_M_co", bound=int, covariant=True)
 _T_co = TypeVar("_T_co", bound=Elem, covariant=True)
@@ -22,63 +41,89 @@ class Vec(Generic[_N_co, _T_co]):
     """A 1D vector."""
 
     _n: _N_co
-    _np: np.ndarray[tuple[_N_co], np.dtype[np.object_]]
+    _np: np.ndarray[tuple[_N_co], np.dtype[_Native]]
 
     def __init__(self, it: Iterable[_T_co], n: _N_co | None = None, /) -> None:
-        object.__setattr__(self, "_np", np.array(it))
+        object.__setattr__(self, "_np", _native(it, copy=True))
         object.__setattr__(self, "_n", self._np.shape[0])
         if n is not None:
             assert self._n == n
 
+    @classmethod
+    def _wrap(cls, a: np.ndarray[Any, Any], /) -> Self:
+        """Wrap `a` (a 1D array with a native dtype), without copying it."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "_np", a)
+        object.__setattr__(self, "_n", a.shape[0])
+        return self
+
     @property
     def shape(self, /) -> tuple[_N_co]:
         return (self._n,)
 
     def __add__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Vec):
-            return type(self)(self._np + rhs._np, self._n)
-        return type(self)(self._np + rhs, self._n)
+            return self._wrap(self._np + rhs._np)
+        return self._wrap(self._np + rhs)
 
     def __sub__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Vec):
-            return type(self)(self._np - rhs._np, self._n)
-        return type(self)(self._np - rhs, self._n)
+            return self._wrap(self._np - rhs._np)
+        return self._wrap(self._np - rhs)
 
     def __rsub__(self, lhs: Self | _T_co, /) -> Self:
+        if isinstance(lhs, Simd):
+            return NotImplemented
         if isinstance(lhs, Vec):
-            return type(self)(lhs._np - self._np, self._n)
-        return type(self)(lhs - self._np, self._n)
+            return self._wrap(lhs._np - self._np)
+        return self._wrap(lhs - self._np)
 
     def __mul__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Vec):
-            return type(self)(self._np * rhs._np, self._n)
-        return type(self)(self._np * rhs, self._n)
+            return self._wrap(self._np * rhs._np)
+        return self._wrap(self._np * rhs)
 
     def __truediv__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Vec):
-            return type(self)(self._np / rhs._np, self._n)
-        return type(self)(self._np / rhs, self._n)
+            return self._wrap(self._np / rhs._np)
+        return self._wrap(self._np / rhs)
 
     def __rtruediv__(self, lhs: Self | _T_co, /) -> Self:
+        if isinstance(lhs, Simd):
+            return NotImplemented
         if isinstance(lhs, Vec):
-            return type(self)(lhs._np / self._np, self._n)
-        return type(self)(lhs / self._np, self._n)
+            return self._wrap(lhs._np / self._np)
+        return self._wrap(lhs / self._np)
 
     def __pow__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Vec):
-            return type(self)(self._np**rhs._np, self._n)
-        return type(self)(self._np**rhs, self._n)
+            return self._wrap(self._np**rhs._np)
+        return self._wrap(self._np**rhs)
 
     def __rpow__(self, lhs: Self | _T_co, /) -> Self:
+        if isinstance(lhs, Simd):
+            return NotImplemented
         if isinstance(lhs, Vec):
-            return type(self)(lhs._np**self._np, self._n)
-        return type(self)(lhs**self._np, self._n)
+            return self._wrap(lhs._np**self._np)
+        return self._wrap(lhs**self._np)
 
     __radd__ = __add__
     __rmul__ = __mul__
 
     def __matmul__(self, rhs: Self, /) -> _T_co:
         """This is just the standard dot product of two vectors."""
+        if isinstance(rhs, Simd):
+            return NotImplemented
         return self._np.dot(rhs._np)[()]
 
     __rmatmul__ = __matmul__
@@ -94,7 +139,7 @@ class Mat(Generic[_N_co, _M_co, _T_co]):
 
     _n: _N_co
     _m: _M_co
-    _np: np.ndarray[tuple[_N_co, _M_co], np.dtype[np.object_]]
+    _np: np.ndarray[tuple[_N_co, _M_co], np.dtype[_Native]]
 
     def __init__(
         self,
@@ -103,11 +148,22 @@ class Mat(Generic[_N_co, _M_co, _T_co]):
         m: _M_co | None = None,
         /,
     ) -> None:
-        object.__setattr__(self, "_np", np.array(it))
+        object.__setattr__(self, "_np", _native([*map(_native, it)] if not isinstance(it, np.ndarray) else it, copy=True))
         object.__setattr__(self, "_n", self._np.shape[0])
         object.__setattr__(self, "_m", self._np.shape[1])
         if n is not None:
             assert self._n == n
+        if m is not None:
+            assert self._m == m
+
+    @classmethod
+    def _wrap(cls, a: np.ndarray[Any, Any], /) -> Self:
+        """Wrap `a` (a 2D array with a native dtype), without copying it."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "_np", a)
+        object.__setattr__(self, "_n", a.shape[0])
+        object.__setattr__(self, "_m", a.shape[1])
+        return self
 
     @property
     def shape(self, /) -> tuple[_N_co, _M_co]:
@@ -115,47 +171,63 @@ class Mat(Generic[_N_co, _M_co, _T_co]):
 
     def __iter__(self, /) -> Iterator[Vec[_M_co, _T_co]]:
         for row in self._np:
-            yield Vec(row, self._m)
+            yield Vec._wrap(row)
 
     def __add__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Mat):
-            return type(self)(self._np + rhs._np, self._n, self._m)
-        return type(self)(self._np + rhs, self._n, self._m)
+            return self._wrap(self._np + rhs._np)
+        return self._wrap(self._np + rhs)
 
     def __sub__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Mat):
-            return type(self)(self._np - rhs._np, self._n, self._m)
-        return type(self)(self._np - rhs, self._n, self._m)
+            return self._wrap(self._np - rhs._np)
+        return self._wrap(self._np - rhs)
 
     def __rsub__(self, lhs: Self | _T_co, /) -> Self:
+        if isinstance(lhs, Simd):
+            return NotImplemented
         if isinstance(lhs, Mat):
-            return type(self)(lhs._np - self._np, self._n, self._m)
-        return type(self)(lhs - self._np, self._n, self._m)
+            return self._wrap(lhs._np - self._np)
+        return self._wrap(lhs - self._np)
 
     def __mul__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Mat):
-            return type(self)(self._np * rhs._np, self._n, self._m)
-        return type(self)(self._np * rhs, self._n, self._m)
+            return self._wrap(self._np * rhs._np)
+        return self._wrap(self._np * rhs)
 
     def __truediv__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Mat):
-            return type(self)(self._np / rhs._np, self._n, self._m)
-        return type(self)(self._np / rhs, self._n, self._m)
+            return self._wrap(self._np / rhs._np)
+        return self._wrap(self._np / rhs)
 
     def __rtruediv__(self, lhs: Self | _T_co, /) -> Self:
+        if isinstance(lhs, Simd):
+            return NotImplemented
         if isinstance(lhs, Mat):
-            return type(self)(lhs._np / self._np, self._n, self._m)
-        return type(self)(lhs / self._np, self._n, self._m)
+            return self._wrap(lhs._np / self._np)
+        return self._wrap(lhs / self._np)
 
     def __pow__(self, rhs: Self | _T_co, /) -> Self:
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Mat):
-            return type(self)(self._np**rhs._np, self._n, self._m)
-        return type(self)(self._np**rhs, self._n, self._m)
+            return self._wrap(self._np**rhs._np)
+        return self._wrap(self._np**rhs)
 
     def __rpow__(self, lhs: Self | _T_co, /) -> Self:
+        if isinstance(lhs, Simd):
+            return NotImplemented
         if isinstance(lhs, Mat):
-            return type(self)(lhs._np**self._np, self._n, self._m)
-        return type(self)(lhs**self._np, self._n, self._m)
+            return self._wrap(lhs._np**self._np)
+        return self._wrap(lhs**self._np)
 
     __radd__ = __add__
     __rmul__ = __mul__
@@ -169,21 +241,23 @@ class Mat(Generic[_N_co, _M_co, _T_co]):
     def __matmul__[K: int](
         self, rhs: "Mat[_M_co, K, _T_co] | Vec[_M_co, _T_co]", /
     ) -> "Mat[_N_co, K, _T_co] | Vec[_N_co, _T_co]":
+        if isinstance(rhs, Simd):
+            return NotImplemented
         if isinstance(rhs, Mat):
-            return Mat(self._np @ rhs._np, self._n, rhs._m)
+            return Mat._wrap(self._np @ rhs._np)
         else:
-            return Vec(self._np @ rhs._np, self._n)
+            return Vec._wrap(self._np @ rhs._np)
 
     def __rmatmul__(self, lhs: Vec[_N_co, _T_co], /) -> Vec[_M_co, _T_co]:
-        return Vec(lhs._np @ self._np, self._m)
+        return Vec._wrap(lhs._np @ self._np)
 
     @property
     def T(self, /) -> "Mat[_M_co, _N_co, _T_co]":
         """Transpose this matrix."""
-        return Mat(self._np.T, self._m, self._n)
+        return Mat._wrap(self._np.T)
 
     def diag(self: "Mat[_N_co, _N_co, _T_co]", /) -> "Vec[_N_co, _T_co]":
-        return Vec(np.diag(self._np), self._n)
+        return Vec._wrap(np.diag(self._np))
 
     # @property
     # def into_vec[X: Elem](
@@ -192,27 +266,359 @@ class Mat(Generic[_N_co, _M_co, _T_co]):
     #     """Reinterpret `self` as a vector of vectors (rows)"""
     #     ...
 
-    # @property
-    # def into_simd(self, /) -> "Simd[_T_co, _N_co, _M_co]":
-    #     """Reinterpret `self` as a simd"""
-    #     ...
+    @property
+    def into_simd(self, /) -> "Simd[_T_co, _N_co, _M_co]":
+        """Reinterpret `self` as a simd"""
+        return Simd._wrap(self._np, 2, 0)
 
     def rk(self, /) -> int:
         """Evaluate the rank of this matrix."""
-        return np.linalg.matrix_rank(self._np)  # pyright: ignore[reportArgumentType]
+        return int(np.linalg.matrix_rank(self._np))
 
     def det[N: int](self: "Mat[N, N, _T_co]", /) -> _T_co:
         """Evaluate the determinant of this matrix."""
-        return np.linalg.det(self._np)  # pyright: ignore[reportArgumentType]
+        return np.linalg.det(self._np)[()]
 
     def inv[N: int](self: "Mat[N, N, _T_co]", /) -> "Mat[N, N, _T_co]":
         """Evaluate the inverse of this matrix."""
-        return Mat(np.linalg.inv(self._np), self._n, self._n)  # pyright: ignore[reportCallIssue, reportUnknownArgumentType, reportArgumentType]
+        return Mat._wrap(np.linalg.inv(self._np))
+
+    def mat_exp[N: int](self: "Mat[N, N, _T_co]", /) -> "Mat[N, N, _T_co]":
+        """Evaluate the (matrix) exponential of this (square) matrix."""
+        return Mat._wrap(_expm(self._np))
+
+    def mat_log[N: int](self: "Mat[N, N, _T_co]", /) -> "Mat[N, N, _T_co]":
+        """Evaluate the (matrix) natural logarithm of this (square) matrix."""
+        return Mat._wrap(_logm(self._np))
+
+    def mat_exp_grid[N: int, K: int](self: "Mat[N, N, _T_co]", ts: "Vec[K, float]", /) -> "Simd[Mat[N, N, _T_co], K]":
+        """Evaluate `exp(self * t)` for each `t` in `ts` (e.g. the propagator of `dx/dt = self @ x`)."""
+        return Simd._wrap(_expm_grid(self._np, ts._np), 1, 2)
+
+
+type _Kind = int | tuple[int, "_Kind"]
+"""The kind of the elements of a `Simd`: 0 (scalars), 1 (`Vec`s), 2 (`Mat`s) or `(nd, kind)` (`Simd`s)."""
+
+
+def _axes(kind: _Kind, /) -> int:
+    """The number of (trailing) array axes taken by each element of this kind."""
+    if isinstance(kind, int):
+        return kind
+    nd, inner = kind
+    return nd + _axes(inner)
+
+
+def _unwrap(x: Any, /) -> tuple[Any, _Kind]:
+    """The array and the kind of `x` (a `Simd` element, or a `Simd` itself)."""
+    match x:
+        case Simd():
+            return x._np, (x._nd, x._kind)  # pyright: ignore[reportUnknownMemberType]
+        case Mat():
+            return x._np, 2
+        case Vec():
+            return x._np, 1
+        case _:
+            return x, 0
+
+
+def _element(a: Any, kind: _Kind, /) -> Any:
+    """Wrap `a` as an element of this kind."""
+    match kind:
+        case 0:
+            return a[()] if isinstance(a, np.ndarray) else a
+        case 1:
+            return Vec._wrap(a)
+        case 2:
+            return Mat._wrap(a)
+        case (nd, inner):
+            return Simd._wrap(a, nd, inner)
+    raise ValueError(f"Invalid element kind: {kind!r}")
+
+
+def _matmul(a: Any, ka: _Kind, b: Any, kb: _Kind, /) -> tuple[Any, _Kind]:
+    """Batched `@` (broadcasting over the leading axes)."""
+    match ka, kb:
+        case 1, 1:
+            return (a * b).sum(-1), 0
+        case 1, 2:
+            return np.matmul(a[..., None, :], b)[..., 0, :], 1
+        case 2, 1:
+            return np.matmul(a, b[..., :, None])[..., 0], 1
+        case 2, 2:
+            return np.matmul(a, b), 2
+    raise TypeError(f"Unsupported operands for @: element kinds {ka!r} and {kb!r}.")
 
-    # def mat_exp[N: int](self: "Mat[N, N, _T_co]", /) -> "Mat[N, N, _T_co]":
-    #     """Evaluate the (matrix) exponential of this (square) matrix."""
-    #     raise NotImplementedError
 
-    # def mat_log[N: int](self: "Mat[N, N, _T_co]", /) -> "Mat[N, N, _T_co]":
-    #     """Evaluate the (matrix) natural logarithm of this (square) matrix."""
-    #     ...
+@final
+@dataclass(frozen=True, slots=True)
+class Simd(Generic[_T_co, *_S]):
+    """
+    A n-dimensional array, where all operations happen element-wise
+    (including matrix multiplication, reduction, etc.) and are parallelized.
+
+    All elements are stored in a single stacked ndarray: the `_nd` leading axes
+    are the Simd axes, the trailing ones belong to each element (see `_Kind`).
+    """
+
+    _np: np.ndarray[Any, np.dtype[_Native]]
+    _nd: int
+    _kind: _Kind
+
+    # Make NumPy defer to our reflected operators
+    __array_ufunc__ = None
+
+    @classmethod
+    def _wrap(cls, a: np.ndarray[Any, Any], nd: int, kind: _Kind, /) -> Self:
+        """Wrap `a` (a stacked array with a native dtype), without copying it."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "_np", a)
+        object.__setattr__(self, "_nd", nd)
+        object.__setattr__(self, "_kind", kind)
+        return self
+
+    @staticmethod
+    def from_it[X: Elem, N: int](_it: Iterable[X], _ty: type[N] = int, /) -> "Simd[X, N]":
+        if isinstance(_it, np.ndarray):
+            # An array of scalars (one Simd axis per array axis)
+            return Simd._wrap(_native(_it, copy=True), _it.ndim, 0)
+        items = [_unwrap(x) for x in _it]
+        if not items:
+            return Simd._wrap(np.empty(0), 1, 0)
+        kind = items[0][1]
+        if any(k != kind for _, k in items):
+            raise TypeError("All the elements of a Simd must be of the same kind.")
+        return Simd._wrap(_native(np.stack([a for a, _ in items])), 1, kind)
+
+    @property
+    def shape(self, /) -> tuple[*_S]:
+        return self._np.shape[:self._nd]  # type: ignore
+
+    def _operands(self, x: Any, /) -> tuple[Any, Any, _Kind]:
+        """`self`'s and `x`'s arrays, aligned for element-wise operations, and the kind of the result.
+
+        Scalars (and `Simd`s of scalars) broadcast over elements of any kind, on either side.
+        """
+        if isinstance(x, Simd):
+            b, kb = x._np, x._kind  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        else:
+            b, kb = _unwrap(x)
+        if kb == self._kind or not kb:
+            kind = self._kind
+        elif not self._kind:
+            kind = kb
+        else:
+            raise TypeError(f"Incompatible Simd element kinds: {self._kind!r} and {kb!r}.")
+        a = self._np[(..., *[None]*(_axes(kind) - _axes(self._kind)))]
+        if isinstance(x, Simd):
+            b = b[(..., *[None]*(_axes(kind) - _axes(kb)))]  # pyright: ignore[reportUnknownArgumentType]
+        return a, b, kind
+
+    def _same(self, a: np.ndarray[Any, Any], /) -> Self:
+        return self._wrap(a, self._nd, self._kind)
+
+    def __add__(self, rhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(rhs)
+        return Simd._wrap(a + b, self._nd, kind)
+
+    def __sub__(self, rhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(rhs)
+        return Simd._wrap(a - b, self._nd, kind)
+
+    def __rsub__(self, lhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(lhs)
+        return Simd._wrap(b - a, self._nd, kind)
+
+    def __mul__(self, rhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(rhs)
+        return Simd._wrap(a * b, self._nd, kind)
+
+    def __truediv__(self, rhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(rhs)
+        return Simd._wrap(a / b, self._nd, kind)
+
+    def __rtruediv__(self, lhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(lhs)
+        return Simd._wrap(b / a, self._nd, kind)
+
+    def __pow__(self, rhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(rhs)
+        return Simd._wrap(a ** b, self._nd, kind)
+
+    def __rpow__(self, lhs: Any, /) -> "Simd[Any, *_S]":
+        a, b, kind = self._operands(lhs)
+        return Simd._wrap(b ** a, self._nd, kind)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __matmul__(self, rhs: Any, /) -> "Simd[Any, *_S]":
+        b, kb = _unwrap(rhs)
+        if isinstance(rhs, Simd):
+            kb = rhs._kind  # pyright: ignore[reportUnknownMemberType]
+        a, kind = _matmul(self._np, self._kind, b, kb)
+        return Simd._wrap(a, self._nd, kind)
+
+    def __rmatmul__(self, lhs: Any, /) -> "Simd[Any, *_S]":
+        a, ka = _unwrap(lhs)
+        c, kind = _matmul(a, ka, self._np, self._kind)
+        return Simd._wrap(c, self._nd, kind)
+
+    def simd_map[U: Elem](self, _f: Callable[[_T_co], U], /) -> "Simd[U, *_S]":
+        """Apply `_f` to each element (a Python loop: prefer vectorized operations, where possible)."""
+        shape = self.shape
+        out = Simd.from_it([_f(_element(self._np[i], self._kind)) for i in np.ndindex(*shape)])
+        return Simd._wrap(out._np.reshape(*shape, *out._np.shape[1:]), self._nd, out._kind)
+
+    @property
+    def as_scalar(self: "Simd[_T_co]", /) -> "_T_co":
+        """Reinterpret the only element as a scalar."""
+        assert self._nd == 0
+        return _element(self._np, self._kind)
+
+    @property
+    def as_vector[N: int](self: "Simd[_T_co, N]", /) -> "Vec[N, _T_co]":
+        """Reinterpret the only axis as a vector."""
+        assert self._nd == 1 and self._kind == 0
+        return Vec._wrap(self._np)
+
+    @property
+    def as_simd_vec[X: Elem, N: int](self: "Simd[X, *_S, N]", /) -> "Simd[Vec[N, X], *_S]":  # pyright: ignore[reportInvalidTypeForm]
+        """Reinterpret the last axis as a vector."""
+        assert self._nd >= 1 and self._kind == 0
+        return Simd._wrap(self._np, self._nd - 1, 1)
+
+    @property
+    def as_simd_mat[X: Elem, N: int, M: int](self: "Simd[X, *_S, N, M]", /) -> "Simd[Mat[N, M, X], *_S]":  # pyright: ignore[reportInvalidTypeForm]
+        """Reinterpret the last two axes as a matrix."""
+        assert self._nd >= 2 and self._kind == 0
+        return Simd._wrap(self._np, self._nd - 2, 2)
+
+    # @property
+    # def as_vec_simd[X: Elem, N: int](self: "Simd[X, N, *_S]", /) -> "Vec[N, Simd[X, *_S]]":
+    #     """Reinterpret the first axis as a vector."""
+    #     ...  # TODO: `Vec`s of non-scalar elements
+
+    @property
+    def as_matrix[N: int, M: int](self: "Simd[_T_co, N, M]", /) -> "Mat[N, M, _T_co]":
+        assert self._nd == 2 and self._kind == 0
+        return Mat._wrap(self._np)
+
+    @property
+    def simd_join[X: Elem, *Z](self: "Simd[Simd[X, *Z], *_S]", /) -> "Simd[X, *_S, *Z]":
+        assert isinstance(self._kind, tuple)
+        nd, kind = self._kind
+        return Simd._wrap(self._np, self._nd + nd, kind)
+
+    @property
+    def mat_T[N: int, M: int, X: Elem](self: "Simd[Mat[N, M, X], *_S]", /) -> "Simd[Mat[M, N, X], *_S]":
+        """Transpose all elements, treating each of them as a matrix."""
+        assert self._kind == 2
+        return self._same(np.swapaxes(self._np, -1, -2))
+
+    def mat_rk[N: int, M: int, X: Elem](self: "Simd[Mat[N, M, X], *_S]", /) -> "Simd[int, *_S]":
+        assert self._kind == 2
+        return Simd._wrap(np.linalg.matrix_rank(self._np).astype(np.int64), self._nd, 0)
+
+    def mat_det[N: int, X: Elem](self: "Simd[Mat[N, N, X], *_S]", /) -> "Simd[X, *_S]":
+        assert self._kind == 2
+        return Simd._wrap(np.linalg.det(self._np), self._nd, 0)
+
+    def mat_inv[N: int, X: Elem](self: "Simd[Mat[N, N, X], *_S]", /) -> "Simd[Mat[N, N, X], *_S]":
+        assert self._kind == 2
+        return self._same(np.linalg.inv(self._np))
+
+    def mat_exp[N: int, X: Elem](self: "Simd[Mat[N, N, X], *_S]", /) -> "Simd[Mat[N, N, X], *_S]":
+        assert self._kind == 2
+        return self._same(_expm(self._np))
+
+    def mat_log[N: int, X: Elem](self: "Simd[Mat[N, N, X], *_S]", /) -> "Simd[Mat[N, N, X], *_S]":
+        assert self._kind == 2
+        return self._same(_logm(self._np))
+
+
+# --- Matrix functions (on stacks of square matrices) ---
+
+# Padé [13/13] approximant of exp (Higham, 2005)
+_EXPM_B = (
+    64764752532480000., 32382376266240000., 7771770303897600., 1187353796428800.,
+    129060195264000., 10559470521600., 670442572800., 33522128640., 1323241920.,
+    40840800., 960960., 16380., 182., 1.,
+)
+_EXPM_THETA = 5.371920351148152
+
+
+def _norm1(a: np.ndarray[Any, Any], /) -> np.ndarray[Any, Any]:
+    return np.abs(a).sum(axis=-2).max(axis=-1)
+
+
+def _expm(a: np.ndarray[Any, Any], /) -> np.ndarray[Any, Any]:
+    """Matrix exponential, by scaling and squaring with a degree-13 Padé approximant."""
+    a = a if a.dtype.kind == "c" else a.astype(np.float64)
+    # Scale each matrix so that its norm is below θ13
+    with np.errstate(divide="ignore"):
+        s = np.maximum(0, np.ceil(np.log2(_norm1(a)/_EXPM_THETA))).astype(np.int64)
+    a = a / np.exp2(s)[..., None, None]
+    b = _EXPM_B
+    eye = np.broadcast_to(np.eye(a.shape[-1]), a.shape)
+    a2 = a @ a
+    a4 = a2 @ a2
+    a6 = a4 @ a2
+    u = a @ (a6 @ (b[13]*a6 + b[11]*a4 + b[9]*a2) + b[7]*a6 + b[5]*a4 + b[3]*a2 + b[1]*eye)
+    v = a6 @ (b[12]*a6 + b[10]*a4 + b[8]*a2) + b[6]*a6 + b[4]*a4 + b[2]*a2 + b[0]*eye
+    r = np.linalg.solve(v - u, v + u)
+    # Undo the scaling, by repeated squaring (only where needed)
+    for k in range(int(s.max(initial=0))):
+        todo = s > k
+        r = np.where(todo[..., None, None], r @ r, r) if todo.ndim else r @ r
+    return r
+
+
+def _sqrtm(a: np.ndarray[Any, Any], /) -> np.ndarray[Any, Any]:
+    """Principal matrix square root (Denman–Beavers iteration)."""
+    y, z = a, np.broadcast_to(np.eye(a.shape[-1]), a.shape)
+    for _ in range(100):
+        y, z, y0 = (y + np.linalg.inv(z))/2, (z + np.linalg.inv(y))/2, y
+        if np.all(_norm1(y - y0) <= 1e-14 * _norm1(y)):
+            break
+    return y
+
+
+def _logm(a: np.ndarray[Any, Any], /) -> np.ndarray[Any, Any]:
+    """Principal matrix logarithm, by inverse scaling and squaring with a degree-8 Padé approximant.
+
+    Raise `ValueError` if some matrix has eigenvalues on the closed negative real axis.
+    """
+    a = a if a.dtype.kind == "c" else a.astype(np.float64)
+    lam = np.linalg.eigvals(a)
+    if ((lam.imag == 0) & (lam.real <= 0)).any():
+        raise ValueError("The principal matrix logarithm is undefined for eigenvalues on the closed negative real axis.")
+    eye = np.broadcast_to(np.eye(a.shape[-1]), a.shape)
+    # Take square roots until every matrix is close enough to the identity
+    s = np.zeros(a.shape[:-2], np.int64)
+    for _ in range(64):
+        todo = _norm1(a - eye) > .25
+        if not todo.any():
+            break
+        a = np.where(todo[..., None, None], _sqrtm(a), a) if todo.ndim else _sqrtm(a)
+        s += todo
+    # log(I + X), as a Gauss–Legendre quadrature of ∫ X (I + tX)⁻¹ dt (i.e. the Padé approximant)
+    x = a - eye
+    nodes, weights = np.polynomial.legendre.leggauss(8)
+    r = sum(w/2 * np.linalg.solve(eye + (t + 1)/2 * x, x) for t, w in zip(nodes, weights))
+    return np.exp2(s)[..., None, None] * r
+
+
+def _expm_grid(a: np.ndarray[Any, Any], ts: np.ndarray[Any, Any], /) -> np.ndarray[Any, Any]:
+    """`exp(a * t)` for each `t` in `ts`, sharing the work across time points."""
+    ts = np.asarray(ts, dtype=np.float64)
+    # Diagonalize once: exp(a t) = V exp(Λ t) V⁻¹
+    lam, vecs = np.linalg.eig(a)
+    # Only trust the eigendecomposition if it is well conditioned and reproduces `a` accurately
+    if np.linalg.cond(vecs) < 1e3:
+        inv = np.linalg.inv(vecs)
+        if _norm1((vecs * lam) @ inv - a) <= 1e-13 * _norm1(a):
+            out = (vecs[None] * np.exp(np.multiply.outer(ts, lam))[:, None, :]) @ inv
+            return out.real if a.dtype.kind != "c" else out
+    # Not (safely) diagonalizable: evaluate all the time points as one batch
+    return _expm(np.multiply.outer(ts, a))
+
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Poisson distribution."""
-from math import factorial
-from dataclasses import dataclass
-from typing import Self, override
+from math import factorial, inf as oo
+from dataclasses import dataclass, field
+from typing import Any, Self, Sequence, override
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._numerics import is_natural, log_comb, scalar_or_array, xlogy
 from .measure import MeasureLike
 from .distribution import DiscreteDistribution, DistributionFit, ADataSet
 
@@ -18,6 +22,7 @@ class Bernoulli(DiscreteDistribution):
     n: int
     n_trials:  int
     p_success: float
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     @override
@@ -29,14 +34,31 @@ class Bernoulli(DiscreteDistribution):
     def average(self, /) -> float:
         return self.p_success * self.n_trials
 
+    @property
+    @override
+    def support_max(self, /) -> float:
+        return self.n_trials
+
+    @override
+    def logpdf(self, x: ArrayLike) -> Any:
+        n, p, x = self.n_trials, self.p_success, np.asarray(x, dtype=np.float64)
+        ok = is_natural(x) & (x <= n)
+        k = np.where(ok, x, 0)
+        logp = log_comb(n, k) + xlogy(k, p) + xlogy(n - k, 1 - p)
+        return scalar_or_array(np.where(ok, logp, -oo))
+
+    @classmethod
     @override
-    def pdf(self, x: int) -> float:
-        n, p = self.n_trials, self.p_success
-        return binomial(n, x) * pow(p, x) * pow(1-p, n-x)
+    def _logpdf_many(cls, dists: Sequence[Self], k: NDArray[np.intp], /) -> NDArray[np.float64]:
+        n = np.array([d.n_trials for d in dists], dtype=np.int64)[:, None]
+        p = np.array([d.p_success for d in dists], dtype=np.float64)[:, None]
+        ok = k <= n
+        k = np.where(ok, k, 0)
+        return np.where(ok, log_comb(n, k) + xlogy(k, p) + xlogy(n - k, 1 - p), -oo)
 
     @override
-    def p_worse(self, x: float, /) -> float:
-        raise NotImplementedError  # TODO: Implement this
+    def _draw(self, rng: np.random.Generator, n: int, /) -> NDArray[np.float64]:
+        return rng.binomial(self.n_trials, self.p_success, n).astype(np.float64)
 
     @classmethod
     @override
@@ -1,23 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Split data into bins."""
-from dataclasses import dataclass
-from itertools import chain
+from dataclasses import dataclass, field
 from math import floor, sqrt
 from typing import Any, Callable, Protocol, Self, Sequence, final, override
 
+import numpy as np
+from numpy.typing import NDArray
+
 from .measure import MeasureLike, best
-from .data import ADataSet as _ADataSet
+from .range import Range
+from .data import ADataSet as _ADataSet, CachedDataStats, IndexView, Moments
 from ._lazy import DataSet, dataset
 
 
 @final
 @dataclass(slots=True, frozen=True)
-class Bin[X: MeasureLike[float]](_ADataSet[X]):
+class Bin[X: MeasureLike[float]](CachedDataStats[X], _ADataSet[X]):
     data: Sequence[X]  # pyright: ignore[reportIncompatibleMethodOverride]
     left: float
     center: float
     right: float
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     @override
@@ -41,30 +45,195 @@ class Bin[X: MeasureLike[float]](_ADataSet[X]):
         return f"<Bin: [{self.left}, {self.right}], n={self.n}>"
 
 
-@final
-@dataclass(frozen=True, slots=True)
-class BinSet[X: MeasureLike[float], D: _ADataSet[MeasureLike[float]]](_ADataSet[X]):
-    """A `DataSet` of `Bin`s"""
+class ABinSet[X: MeasureLike[float], D: _ADataSet[MeasureLike[float]]](CachedDataStats[X], _ADataSet[X], Protocol):
+    """A `DataSet` of `Bin`s, stored compactly as bin centers and counts.
+
+    Statistics only depend on the counts (O(nbins)): the original data
+    is only accessed again when the `Bin`s themselves are requested.
+    """
     orig: D
     """Original data."""
-    bins: Sequence[Bin[X]]
+    counts: NDArray[np.intp]
+    """The number of data points in each bin."""
+
+    @property
+    def nbins(self, /) -> int:
+        return self.counts.shape[0]
+
+    @property
+    def centers(self, /) -> NDArray[np.float64]: ...
+
+    @property
+    def lefts(self, /) -> NDArray[np.float64]:
+        """The left edge of each bin."""
+        ...
+
+    @property
+    def rights(self, /) -> NDArray[np.float64]:
+        """The right edge of each bin."""
+        ...
+
+    def _groups(self, /) -> NDArray[np.intp]:
+        """The positions of the original data points, grouped by bin."""
+        ...
+
+    @property
+    def bins(self, /) -> tuple[Bin[X], ...]:
+        return self._cached("bins", ABinSet._bins)
+
+    def _bins(self, /) -> tuple[Bin[X], ...]:
+        if not self.nbins:
+            return ()
+        # Each bin is a view on the original data (no copies)
+        views = np.split(self._groups(), np.cumsum(self.counts[:-1]))
+        return tuple([
+            Bin.ranged(IndexView(self.orig, idx), left, right)  # type: ignore
+            for idx, left, right in zip(views, self.lefts.tolist(), self.rights.tolist())
+        ])
 
     @property
     @override
     def data(self, /) -> tuple[X, ...]:
-        return tuple(chain.from_iterable([[b.best]*b.n for b in self.bins]))  # type: ignore
+        return tuple(self.bests.tolist())  # type: ignore
+
+    @property
+    @override
+    def bests(self, /) -> NDArray[np.float64]:
+        return np.repeat(self.centers, self.counts)
 
     @property
     @override
     def n(self, /) -> int:
-        return len(self.data)
+        return self.moments.n
+
+    @property
+    @override
+    def moments(self, /) -> Moments[X]:
+        return self._cached("moments", ABinSet._moments)
+
+    def _moments(self, /) -> Moments[X]:
+        x, w = self.centers, self.counts
+        n = int(w.sum())
+        if not n:
+            return Moments(0, 0., 0., None, None)
+        s = float(x @ w)
+        nonempty = np.flatnonzero(w)
+        return Moments(
+            n, s, float(np.square(x - s/n) @ w)/n,
+            float(x[nonempty[0]]), float(x[nonempty[-1]]),  # type: ignore
+        )
+
+    @override
+    def map[A: MeasureLike[float], B: MeasureLike[float]](self: "ABinSet[A, Any]", f: Callable[[A], B], /) -> "DataSet[B]":
+        return dataset(self.data).map(f)
+
+    @override
+    def __repr__(self, /) -> str:
+        return f"<{type(self).__name__}: nbins={self.nbins}, n={self.n}>"
+
+
+@final
+@dataclass(frozen=True, slots=True, eq=False)
+class BinSet[X: MeasureLike[float], D: _ADataSet[MeasureLike[float]]](ABinSet[X, D]):
+    """A `DataSet` of contiguous, equally spaced `Bin`s."""
+    orig: D
+    """Original data."""
+    edges: NDArray[np.float64]
+    """The `nbins + 1` (equally spaced) bin edges."""
+    counts: NDArray[np.intp]
+    """The number of data points in each bin."""
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def of[Y: MeasureLike[float], E: _ADataSet[MeasureLike[float]]](cls, orig: E, edges: NDArray[np.float64], /) -> "BinSet[Y, E]":
+        """Bin `orig` with the given (equally spaced) edges, e.g. `Range.edges(nbins)`."""
+        edges = np.asarray(edges, dtype=np.float64)
+        if edges.shape[0] < 2:
+            return BinSet(orig, np.empty(0), np.zeros(0, np.intp))
+        return BinSet(orig, edges, histogram(orig.bests, float(edges[0]), float(edges[-1]), edges.shape[0]-1))
+
+    @property
+    @override
+    def centers(self, /) -> NDArray[np.float64]:
+        return self._cached("centers", lambda self: (self.edges[:-1] + self.edges[1:])/2)
+
+    @property
+    @override
+    def lefts(self, /) -> NDArray[np.float64]:
+        return self.edges[:-1]
+
+    @property
+    @override
+    def rights(self, /) -> NDArray[np.float64]:
+        return self.edges[1:]
 
     @override
-    def map[A: MeasureLike[float], B: MeasureLike[float]](self: "BinSet[A, Any]", f: Callable[[A], B], /) -> "DataSet[B]":
-        return DataSet(self.data).map(f)
+    def _groups(self, /) -> NDArray[np.intp]:
+        return group(self.orig.bests, float(self.edges[0]), float(self.edges[-1]), self.nbins)
 
 
-type AnyBinSet[X: MeasureLike[float]] = BinSet[X, _ADataSet[X]]
+@final
+@dataclass(frozen=True, slots=True, eq=False)
+class IntBinSet[X: MeasureLike[int], D: _ADataSet[MeasureLike[float]]](ABinSet[X, D]):
+    """A sparse `DataSet` of unit-width integer `Bin`s: only occupied values are stored."""
+    orig: D
+    """Original data."""
+    values: NDArray[np.int64]
+    """The (sorted) integer values that occur in `orig`."""
+    counts: NDArray[np.intp]
+    """The number of data points for each value."""
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def of[Y: MeasureLike[int], E: _ADataSet[MeasureLike[float]]](cls, orig: E, /) -> "IntBinSet[Y, E]":
+        values, counts = np.unique(np.rint(orig.bests).astype(np.int64), return_counts=True)
+        return IntBinSet(orig, values, counts)
+
+    @property
+    @override
+    def centers(self, /) -> NDArray[np.float64]:
+        return self._cached("centers", lambda self: self.values.astype(np.float64))
+
+    @property
+    @override
+    def lefts(self, /) -> NDArray[np.float64]:
+        return self.centers - .5
+
+    @property
+    @override
+    def rights(self, /) -> NDArray[np.float64]:
+        return self.centers + .5
+
+    @override
+    def _groups(self, /) -> NDArray[np.intp]:
+        return np.argsort(self.orig.bests, kind="stable")
+
+
+def _bin_indices(x: NDArray[np.float64], left: float, right: float, nbins: int, /) -> NDArray[np.intp]:
+    # Bin indices, via edge arithmetic; out-of-range values are mapped to -1 or nbins.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        i = np.floor(np.clip((x - left)/((right - left)/nbins), -1, nbins)).astype(np.intp)
+    i[x == right] = nbins-1
+    return i
+
+
+def histogram(x: NDArray[np.float64], left: float, right: float, nbins: int, /) -> NDArray[np.intp]:
+    """Count the values of `x` in each of `nbins` equal bins between `left` and `right` (both included)."""
+    i = _bin_indices(x, left, right, nbins)
+    return np.bincount(i[(i >= 0) & (i < nbins)], minlength=nbins)
+
+
+def group(x: NDArray[np.float64], left: float, right: float, nbins: int, /) -> NDArray[np.intp]:
+    """The positions of the values of `x`, grouped by bin (see `histogram`); values out of range are dropped."""
+    i = _bin_indices(x, left, right, nbins)
+    inside = np.flatnonzero((i >= 0) & (i < nbins))
+    i = i[inside]
+    # A stable counting sort (radix sort on small integer keys)
+    key = i.astype(np.uint16) if nbins <= 1 << 16 else i
+    return inside[np.argsort(key, kind="stable")]
+
+
+type AnyBinSet[X: MeasureLike[float]] = ABinSet[X, _ADataSet[X]]
 
 
 class ADataSet[X: MeasureLike[float]](_ADataSet[X], Protocol):
@@ -77,30 +246,23 @@ class ADataSet[X: MeasureLike[float]](_ADataSet[X], Protocol):
         if nbins is None:
             nbins = int(floor(sqrt(self.n)))
         if nbins <= 0:
-            return BinSet(self, ())
+            return BinSet(self, np.empty(0), np.zeros(0, np.intp))
         if left is None:
             left = best(self.min)
         if right is None:
             right = best(self.max)
-        # Create bins
-        dx = (right - left)/nbins
-        bins: list[list[X]] = [[] for _ in range(nbins)]
-        # Populate bins
-        for x in sorted(self.data, key=best):
-            if x == right:
-                i = nbins-1
-            else:
-                i = int(floor((best(x) - left)/dx))
-            if i < 0 or i >= nbins:
-                continue
-            bins[i].append(x)
-        # Return the results
-        return BinSet(self, tuple([Bin.ranged(bin, left+i*dx, left+(i+1)*dx) for i, bin in enumerate(bins)]))
-
-    def intbins[T: MeasureLike[int]](self: "ADataSet[T]", /) -> BinSet[T, "ADataSet[T]"]:
-        """Split `self` (integer data set) into bins."""
-        max, min = best(self.max), best(self.min)
+        return BinSet.of(self, Range("[", left, right, "]").edges(nbins))
+
+    def intbins[T: MeasureLike[int]](self: "ADataSet[T]", /, *, sparse: bool = False) -> ABinSet[T, "ADataSet[T]"]:
+        """Split `self` (integer data set) into unit bins, one per integer value.
+
+        If `sparse`, only store the occupied values (as an `IntBinSet`), so that memory scales
+        with the number of distinct values rather than with their range.
+        """
+        if sparse:
+            return IntBinSet.of(self)
+        max, min = int(best(self.max)), int(best(self.min))
         return self.bins(max+1-min, left=min-.5, right=max+.5)
 
 
-__all__ = ["Bin", "BinSet", "AnyBinSet", "ADataSet"]
+__all__ = ["Bin", "ABinSet", "BinSet", "IntBinSet", "histogram", "group", "AnyBinSet", "ADataSet"]
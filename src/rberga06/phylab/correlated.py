@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Measures that keep track of their correlations."""
+from dataclasses import dataclass
+from itertools import count
+from math import sqrt
+from typing import Any, Callable, Iterable, Mapping, Self, final
+
+import weakref
+
+import numpy as np
+
+from ._tensor_numpy import Mat
+from .dual import Dual
+from .measure import Datum, Measure, MeasureLike, best, delta
+
+
+_ids = count()
+"""Identifiers of the independent inputs."""
+
+_inputs: dict[int, int] = {}
+"""Identifiers of the plain measures used so far as inputs (keyed by `id()`)."""
+
+_pinned: list[object] = []
+"""Inputs that can't be weakly referenced (kept alive, so that their `id()` is never reused)."""
+
+
+def _input_id(x: object, /) -> int:
+    """The identifier of the plain measure `x` (the same every time `x` is used)."""
+    key = id(x)
+    if (i := _inputs.get(key)) is None:
+        i = _inputs[key] = next(_ids)
+        try:
+            weakref.finalize(x, _inputs.pop, key, None)
+        except TypeError:
+            _pinned.append(x)
+    return i
+
+
+@final
+@dataclass(slots=True, frozen=True, eq=False)
+class Correlated:
+    """A measure that remembers how it depends on independent inputs.
+
+    `components` maps (the identifier of) each input to its contribution to the error,
+    i.e. `∂self/∂input * δinput`: only actual dependencies are stored.
+    Errors are combined in quadrature, so a quantity used several times
+    in the same formula (e.g. `constants.g`) is correctly treated as correlated.
+    """
+    best: float
+    components: Mapping[int, float]
+
+    # Make `Measure` and NumPy defer to our reflected operators
+    __array_ufunc__ = None
+
+    @classmethod
+    def independent(cls, x: MeasureLike[float], /) -> Self:
+        """`x` as an independent input.
+
+        A plain measure is always the same input (i.e. it's correlated with itself);
+        a `Correlated` forgets its correlations and becomes a new input.
+        """
+        if isinstance(x, Correlated):
+            return cls(x.best, {next(_ids): x.delta})
+        if isinstance(x, float | int):
+            return cls(float(x), {})
+        return cls(best(x), {_input_id(x): delta(x)})
+
+    @classmethod
+    def _of(cls, x: Dual | float, /) -> Self:
+        if isinstance(x, Dual):
+            return cls(float(x.value), x.partials)
+        return cls(float(x), {})
+
+    @property
+    def delta(self, /) -> float:
+        return sqrt(sum([c*c for c in self.components.values()]))
+
+    @property
+    def delta_rel(self, /) -> float:
+        return self.delta / abs(self.best)
+
+    @property
+    def datum(self, /) -> Datum[float]:
+        """Forget about correlations."""
+        return Datum(self.best, self.delta)
+
+    def apply(self, f: Callable[[Dual], Dual | float], /) -> "Correlated":
+        """Apply `f` (e.g. one of the functions in `rberga06.phylab.dual`)."""
+        return Correlated._of(f(_dual(self)))
+
+    def cov(self, other: "Correlated", /) -> float:
+        """The covariance of `self` and `other`."""
+        a, b = self.components, other.components
+        if len(b) < len(a):
+            a, b = b, a
+        return sum([c * b[i] for i, c in a.items() if i in b], 0.)
+
+    # --- Operators ---
+
+    def __pos__(self, /) -> Self:
+        return self
+
+    def __neg__(self, /) -> "Correlated":
+        return Correlated._of(-_dual(self))
+
+    def __abs__(self, /) -> "Correlated":
+        return Correlated._of(abs(_dual(self)))
+
+    def __add__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(self) + _dual(other))
+
+    def __sub__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(self) - _dual(other))
+
+    def __mul__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(self) * _dual(other))
+
+    def __truediv__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(self) / _dual(other))
+
+    def __pow__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(self) ** _dual(other))
+
+    def __radd__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(other) + _dual(self))
+
+    def __rsub__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(other) - _dual(self))
+
+    def __rmul__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(other) * _dual(self))
+
+    def __rtruediv__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(other) / _dual(self))
+
+    def __rpow__(self, other: "_Operand", /) -> "Correlated":
+        return Correlated._of(_dual(other) ** _dual(self))
+
+    # --- Comparison ---
+
+    def ε(self, other: "_Operand", /) -> float:
+        diff = self - other
+        return diff.best / diff.delta
+
+
+type _Operand = Correlated | Measure[float] | Measure[int] | float
+
+
+def _dual(x: _Operand, /) -> Dual | Any:
+    """`x` as a dual number (a plain `Measure` is an independent input)."""
+    if isinstance(x, Correlated):
+        return Dual(x.best, x.components)
+    if isinstance(x, float | int):
+        return x
+    return Dual(x.best, {_input_id(x): x.delta})
+
+
+def independent(x: MeasureLike[float], /) -> Correlated:
+    """`x` as an independent input."""
+    return Correlated.independent(x)
+
+
+def independents(xs: Iterable[MeasureLike[float]], /) -> tuple[Correlated, ...]:
+    """Many independent inputs."""
+    return tuple(map(Correlated.independent, xs))
+
+
+def covariance(*xs: Correlated) -> Mat[int, int, float]:
+    """The covariance matrix of `xs`."""
+    n = len(xs)
+    cov = np.empty((n, n))
+    for i in range(n):
+        for j in range(i, n):
+            cov[i, j] = cov[j, i] = xs[i].cov(xs[j])
+    return Mat._wrap(cov)
+
+
+def correlation(*xs: Correlated) -> Mat[int, int, float]:
+    """The (Pearson) correlation matrix of `xs`."""
+    cov = covariance(*xs)._np
+    d = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return Mat._wrap(cov / np.outer(d, d))
+
+
+__all__ = ["Correlated", "independent", "independents", "covariance", "correlation"]
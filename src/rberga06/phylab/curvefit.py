@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Least-squares fits of `y = f(x; params)` to measured data."""
+import warnings
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Literal, Sequence, final
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._numerics import chi2_sf, xlogy
+from ._tensor_numpy import Mat, Simd
+from .bins import ABinSet
+from .data import DataStats
+from .distribution import ChiSquare
+from .measure import Datum, MeasureArray, MeasureLike
+
+
+type _Data = DataStats[MeasureLike[float]] | MeasureArray | ArrayLike | Iterable[MeasureLike[float]]
+"""Measured values: a data set, a `MeasureArray`, an array of numbers or a sequence of measures."""
+
+
+def _columns(data: _Data, /) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """The best values and the deltas of `data`, as arrays."""
+    if isinstance(data, MeasureArray):
+        return data.best, data.delta
+    if hasattr(data, "bests"):  # a data set
+        return data.bests, data.deltas  # type: ignore
+    if isinstance(data, np.ndarray):
+        return data.astype(np.float64, copy=False), np.zeros(data.shape)
+    m = MeasureArray.of(data)  # pyright: ignore[reportArgumentType]
+    return m.best, m.delta
+
+
+class ConvergenceWarning(RuntimeWarning):
+    """A nonlinear fit did not converge (its result may be far from the optimum)."""
+
+
+@final
+@dataclass(slots=True, frozen=True, eq=False)
+class CurveFit:
+    """The result of a least-squares fit (in batch mode, one row per data set)."""
+    params: tuple[Datum[float], ...] | MeasureArray
+    """The fitted parameters."""
+    cov: Mat[int, int, float] | Simd[Mat[int, int, float], int]
+    """The covariance matrix of the parameters."""
+    chi2: ChiSquare
+    """The χ² of the residuals."""
+
+
+def _result(p: NDArray[np.float64], cov: NDArray[np.float64], chi2: Any, ndf: int, /) -> CurveFit:
+    delta = np.sqrt(np.diagonal(cov, axis1=-2, axis2=-1))
+    test = ChiSquare(chi2, ndf, chi2_sf(chi2, ndf)[()])
+    if p.ndim == 1:
+        return CurveFit(tuple(map(Datum, p.tolist(), delta.tolist())), Mat._wrap(cov), test)
+    return CurveFit(MeasureArray(p, delta), Simd._wrap(cov, cov.ndim - 2, 2), test)
+
+
+def _ndf(npoints: int, nparams: int, /) -> int:
+    """The degrees of freedom of a fit (raise `ValueError` if the parameters are underdetermined)."""
+    if npoints < nparams:
+        raise ValueError(f"Cannot fit {nparams} parameters to {npoints} points.")
+    return npoints - nparams
+
+
+def _residual_variance(chi2: Any, ndf: int, /) -> Any:
+    """`chi2/ndf`, i.e. the variance of the residuals (undefined, hence infinite, if `ndf == 0`)."""
+    return chi2/ndf if ndf > 0 else np.full_like(chi2, np.inf, dtype=np.float64)
+
+
+def _weights(deltas: NDArray[np.float64], /) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """The σ to weight each point with, and which data sets have no errors at all."""
+    unweighted = ~(deltas != 0).any(axis=-1)
+    sigma = np.where(unweighted[..., None], 1., deltas)
+    if not (sigma > 0).all():
+        raise ValueError("Cannot weight points with a null error (all the errors must be either zero or positive).")
+    return sigma, unweighted
+
+
+def linear_fit(x: _Data, y: _Data, basis: Sequence[Callable[[NDArray[np.float64]], ArrayLike]], /) -> CurveFit:
+    """Weighted linear least-squares fit of `y = Σ params[j] * basis[j](x)`.
+
+    The deltas on `y` are used as weights (the ones on `x` are ignored). If there are none,
+    all the points get the same weight and the covariance is estimated from the residuals.
+    If `y` is 2D, each row is a separate data set and all of them are fitted at once (batch mode).
+    """
+    xb, _ = _columns(x)
+    yb, yd = _columns(y)
+    ndf = _ndf(yb.shape[-1], len(basis))
+    sigma, unweighted = _weights(yd)
+    design = np.stack([np.broadcast_to(np.asarray(f(xb), np.float64), xb.shape) for f in basis], axis=-1)
+    # Whiten: minimize |b - A p|², with A = design/σ and b = y/σ
+    nd = yb.ndim - 1
+    a = Simd._wrap(design / sigma[..., None], nd, 2)
+    b = yb / sigma
+    at = a.mat_T
+    cov = (at @ a).mat_inv()._np
+    p = (Simd._wrap(cov, nd, 2) @ (at @ Simd._wrap(b, nd, 1)))._np
+    r = b - (a @ Simd._wrap(p, nd, 1))._np
+    chi2 = (r*r).sum(axis=-1)
+    cov = cov * np.where(unweighted, _residual_variance(chi2, ndf), 1.)[..., None, None]
+    return _result(p, cov, chi2[()], ndf)
+
+
+def polyfit(x: _Data, y: _Data, deg: int, /) -> CurveFit:
+    """Weighted least-squares fit of a polynomial of degree `deg` (parameters in increasing power order; see `linear_fit`)."""
+    return linear_fit(x, y, [lambda x, k=k: x**k for k in range(deg + 1)])
+
+
+def _fd_jacobian(
+    f: Callable[..., ArrayLike], x: NDArray[np.float64], p: NDArray[np.float64], y0: NDArray[np.float64], /,
+) -> NDArray[np.float64]:
+    """Forward finite differences, with all the parameters perturbed in a single (broadcast) call to `f`."""
+    k, n = p.shape[0], y0.shape[0]
+    h = np.sqrt(np.finfo(np.float64).eps) * np.maximum(np.abs(p), 1.)
+    shifted = p + np.diag(h)  # row j: parameter j perturbed
+    try:
+        ys = np.asarray(f(x, *shifted.T[..., None]), np.float64)
+    except (TypeError, ValueError):
+        ys = None  # e.g. `f` calls `math` functions on its parameters
+    if ys is None or ys.shape != (k, n):
+        # `f` does not broadcast over its parameters
+        ys = np.stack([np.broadcast_to(np.asarray(f(x, *q), np.float64), (n,)) for q in shifted])
+    return ((ys - y0)/h[:, None]).T
+
+
+def _levenberg_marquardt(
+    model: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+    jacobian: Callable[[NDArray[np.float64], NDArray[np.float64]], NDArray[np.float64]],
+    weights: Callable[[NDArray[np.float64]], NDArray[np.float64]],
+    cost: Callable[[NDArray[np.float64]], float],
+    y: NDArray[np.float64], p: NDArray[np.float64], /, max_iter: int, tol: float,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], float, bool]:
+    """Minimize `cost(model(p))`, with Gauss–Newton steps (weighted by `weights(model(p))`) damped as needed.
+
+    Return the optimal parameters, the model and the cost there, and whether the minimization converged.
+    """
+    mu = model(p)
+    c = cost(mu)
+    lam = 1e-3
+    for _ in range(max_iter):
+        j = jacobian(p, mu)
+        wj = j * weights(mu)[:, None]
+        a = j.T @ wj
+        g = wj.T @ (y - mu)
+        # Increase the damping until the step reduces the cost
+        while True:
+            step = np.linalg.solve(a + lam*np.diag(np.diag(a)), g)
+            mu_new = model(p + step)
+            c_new = cost(mu_new)
+            if np.isfinite(c_new) and c_new <= c:
+                break
+            lam *= 10
+            if lam > 1e16:
+                # No step helps: fine if even the undamped one can't do better than round-off
+                stuck = not (np.isfinite(c) and np.isfinite(a).all() and g @ np.linalg.lstsq(a, g)[0] <= tol*c)
+                return p, mu, c, not stuck
+        p, mu, dc, c = p + step, mu_new, c - c_new, c_new
+        lam = max(lam/10, 1e-12)
+        if (np.abs(step) <= tol*(np.abs(p) + tol)).all() or dc <= tol*c:
+            return p, mu, c, True
+    return p, mu, c, False
+
+
+def curve_fit(
+    f: Callable[..., ArrayLike], x: _Data | ABinSet[Any, Any], y: _Data | None = None, /, *,
+    p0: Sequence[float],
+    jac: Callable[..., Sequence[ArrayLike]] | None = None,
+    weights: Literal["gauss", "poisson"] = "gauss",
+    max_iter: int = 200,
+    tol: float = 1e-10,
+) -> CurveFit:
+    """Nonlinear least-squares fit of `y = f(x, *params)` (Levenberg–Marquardt), starting from `p0`.
+
+    `f` is evaluated on whole arrays. `jac(x, *params)`, if given, returns the derivatives of `f`
+    with respect to each parameter; otherwise, they are estimated with finite differences.
+    A `BinSet` can be fitted directly (`f` then gives the expected counts at the bin centers).
+
+    With `weights="gauss"`, the deltas on `y` (for bins, the square roots of the counts)
+    are used as weights, as in `linear_fit`. With `weights="poisson"`, `y` are counts and
+    the Poisson likelihood is maximized (the reported χ² is the deviance).
+
+    Emit a `ConvergenceWarning` if the minimization doesn't converge within `max_iter` iterations
+    (or gets stuck before reaching the optimum).
+    """
+    if y is None:
+        if not hasattr(x, "counts"):  # a bin set
+            raise TypeError("curve_fit() needs either a BinSet or both x and y.")
+        xb, yb = x.centers, x.counts.astype(np.float64)  # type: ignore
+        yd = np.sqrt(np.maximum(yb, 1.))
+    else:
+        xb, _ = _columns(x)  # pyright: ignore[reportArgumentType]
+        yb, yd = _columns(y)
+        if weights == "poisson":
+            yd = np.sqrt(np.maximum(yb, 1.))
+    ndf = _ndf(yb.shape[0], len(p0))
+    sigma, unweighted = _weights(yd)
+
+    def model(p: NDArray[np.float64], /) -> NDArray[np.float64]:
+        return np.broadcast_to(np.asarray(f(xb, *p), np.float64), yb.shape)
+
+    def jacobian(p: NDArray[np.float64], mu: NDArray[np.float64], /) -> NDArray[np.float64]:
+        if jac is None:
+            return _fd_jacobian(f, xb, p, mu)
+        return np.stack([np.broadcast_to(np.asarray(d, np.float64), yb.shape) for d in jac(xb, *p)], axis=-1)
+
+    def gauss_weights(mu: NDArray[np.float64], /) -> NDArray[np.float64]:
+        return 1/(sigma*sigma)
+
+    def gauss_cost(mu: NDArray[np.float64], /) -> float:
+        r = (yb - mu)/sigma
+        return float(r @ r)
+
+    def poisson_weights(mu: NDArray[np.float64], /) -> NDArray[np.float64]:
+        return 1/np.maximum(mu, 1e-300)
+
+    def poisson_cost(mu: NDArray[np.float64], /) -> float:
+        if not (mu > 0).all():
+            return np.inf
+        return float(2*(mu - yb + xlogy(yb, yb) - xlogy(yb, mu)).sum())
+
+    w, cost = gauss_weights, gauss_cost
+    p, mu, c, converged = _levenberg_marquardt(model, jacobian, w, cost, yb, np.asarray(p0, np.float64), max_iter, tol)
+    if weights == "poisson":
+        # Start from the Gaussian fit: Fisher scoring is only reliable close to the optimum
+        w, cost = poisson_weights, poisson_cost
+        p, mu, c, converged = _levenberg_marquardt(model, jacobian, w, cost, yb, p, max_iter, tol)
+    if not converged:
+        warnings.warn(f"curve_fit() did not converge (p = {p.tolist()}).", ConvergenceWarning, stacklevel=2)
+    j = jacobian(p, mu)
+    cov = np.linalg.inv(j.T @ (j * w(mu)[:, None]))
+    if unweighted:
+        cov = cov * _residual_variance(c, ndf)
+    return _result(p, cov, c, ndf)
+
+
+__all__ = ["ConvergenceWarning", "CurveFit", "linear_fit", "polyfit", "curve_fit"]
@@ -3,10 +3,17 @@
 # pyright: reportIncompatibleMethodOverride=false
 # pyright: reportIncompatibleVariableOverride=false
 """Abstract data sets & Descriptive statistics."""
+from dataclasses import dataclass
+from itertools import islice
 from math import sqrt
-from typing import TYPE_CHECKING, Callable, Iterator, Protocol, Self, Sequence, overload, override
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Protocol, Self, Sequence, final, overload, override
 
-from .measure import Measure, MeasureLike, best
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._numerics import scalar_or_array
+from .measure import Measure, MeasureLike, best, delta
+from .range import Range, RangeSet
 
 
 def square[X: MeasureLike[float]](x: X, /) -> X:
@@ -23,7 +30,8 @@ class DataSequence[T](Protocol):
         data: Sequence[T]
 
     def map[A, B](self: "DataSequence[A]", f: Callable[[A], B], /) -> "DataSequence[B]":
-        return type(self)(tuple(map(f, self.data)))  # type: ignore
+        # Lazy: `f` is only applied when the data is accessed (chained maps are composed).
+        return type(self)(MapView.of(self.data, f))  # type: ignore
 
     def __len__(self, /) -> int:
         return len(self.data)
@@ -37,10 +45,151 @@ class DataSequence[T](Protocol):
     def __getitem__(self, key: slice, /) -> Self: ...
     def __getitem__(self, key: int | slice, /) -> T | Self:
         if isinstance(key, slice):
-            return type(self)(self.data[key])
+            return type(self)(view(self.data, key))
         return self.data[key]
 
 
+class _View[T](Sequence[T]):
+    """A read-only view, which compares, hashes and prints like the tuple of its elements."""
+    __slots__ = ()
+
+    @override
+    def __eq__(self, other: object, /) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+
+    @override
+    def __hash__(self, /) -> int:
+        return hash(tuple(self))
+
+    @override
+    def __repr__(self, /) -> str:
+        return f"{type(self).__name__}({tuple(self)!r})"
+
+
+@final
+class IndexView[T](_View[T]):
+    """A read-only view of `base`, restricted to the positions in `indices`."""
+    __slots__ = ("base", "indices")
+    base: Sequence[T]
+    indices: NDArray[np.intp]
+
+    def __init__(self, base: Sequence[T], indices: NDArray[np.intp], /) -> None:
+        self.base = base
+        self.indices = indices
+
+    @override
+    def __len__(self, /) -> int:
+        return self.indices.shape[0]
+
+    @overload
+    def __getitem__(self, key: int, /) -> T: ...
+    @overload
+    def __getitem__(self, key: slice, /) -> "IndexView[T]": ...
+    @override
+    def __getitem__(self, key: int | slice, /) -> "T | IndexView[T]":
+        if isinstance(key, slice):
+            return IndexView(self.base, self.indices[key])
+        return self.base[int(self.indices[key])]
+
+    @override
+    def __iter__(self, /) -> Iterator[T]:
+        return map(self.base.__getitem__, self.indices.tolist())
+
+
+@final
+class SliceView[T](_View[T]):
+    """A read-only view of the slice `indices` (a `range`) of `base`."""
+    __slots__ = ("base", "indices")
+    base: Sequence[T]
+    indices: range
+
+    def __init__(self, base: Sequence[T], indices: range, /) -> None:
+        self.base = base
+        self.indices = indices
+
+    @override
+    def __len__(self, /) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, key: int, /) -> T: ...
+    @overload
+    def __getitem__(self, key: slice, /) -> "SliceView[T]": ...
+    @override
+    def __getitem__(self, key: int | slice, /) -> "T | SliceView[T]":
+        if isinstance(key, slice):
+            return SliceView(self.base, self.indices[key])
+        return self.base[self.indices[key]]
+
+    @override
+    def __iter__(self, /) -> Iterator[T]:
+        i = self.indices
+        if i.step == 1:
+            return islice(self.base, i.start, i.stop)
+        return map(self.base.__getitem__, i)
+
+
+@final
+class MapView[A, B](_View[B]):
+    """A lazy view of `base`, with `f` applied to each element.
+
+    `f` is only applied when the elements are first accessed; the results are then kept.
+    """
+    __slots__ = ("base", "f", "_values")
+    base: Sequence[A]
+    f: Callable[[A], B]
+    _values: tuple[B, ...] | None
+
+    def __init__(self, base: Sequence[A], f: Callable[[A], B], /) -> None:
+        self.base = base
+        self.f = f
+        self._values = None
+
+    @classmethod
+    def of[X, Y](cls, base: Sequence[X], f: Callable[[X], Y], /) -> "MapView[Any, Y]":
+        """Map `f` over `base`, composing it with `base`'s function if `base` is a (not yet computed) `MapView`."""
+        if isinstance(base, MapView) and base._values is None:
+            g: Callable[[Any], X] = base.f  # pyright: ignore[reportUnknownMemberType]
+            return MapView(base.base, lambda x: f(g(x)))  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        return MapView(base, f)
+
+    @property
+    def values(self, /) -> tuple[B, ...]:
+        """The mapped elements (computed on first access)."""
+        if self._values is None:
+            self._values = tuple(map(self.f, self.base))
+        return self._values
+
+    @override
+    def __len__(self, /) -> int:
+        return len(self.base)
+
+    @overload
+    def __getitem__(self, key: int, /) -> B: ...
+    @overload
+    def __getitem__(self, key: slice, /) -> "Sequence[B]": ...
+    @override
+    def __getitem__(self, key: int | slice, /) -> "B | Sequence[B]":
+        if isinstance(key, slice):
+            if self._values is not None:
+                return SliceView(self._values, range(len(self))[key])
+            return MapView(view(self.base, key), self.f)
+        return self.values[key]
+
+    @override
+    def __iter__(self, /) -> Iterator[B]:
+        return iter(self.values)
+
+
+def view[T](data: Sequence[T], key: slice, /) -> Sequence[T]:
+    """`data[key]`, without copying the elements."""
+    if isinstance(data, np.ndarray | IndexView | SliceView | MapView):
+        return data[key]  # pyright: ignore[reportUnknownVariableType]
+    return SliceView(data, range(len(data))[key])
+
+
 class AbstractStats(Protocol):
     """Statistics."""
     n: int
@@ -77,6 +226,51 @@ class DataStats[X: MeasureLike[float]](AbstractStats, Protocol):
     def n(self, /) -> int:
         return len(self.data)
 
+    @property
+    def bests(self, /) -> NDArray[np.float64]:
+        """The best values of `data`, as an array."""
+        return np.fromiter(map(best, self.data), np.float64, len(self.data))
+
+    @property
+    def deltas(self, /) -> NDArray[np.float64]:
+        """The uncertainties on `data`, as an array."""
+        return np.fromiter(map(delta, self.data), np.float64, len(self.data))
+
+    @property
+    def order(self, /) -> NDArray[np.intp]:
+        """The positions of the data points, sorted by best value (a sorted index)."""
+        return np.argsort(self.bests, kind="stable")
+
+    @property
+    def sorted_bests(self, /) -> NDArray[np.float64]:
+        """The best values, in ascending order."""
+        return self.bests[self.order]
+
+    def window(self, r: Range | RangeSet, /) -> NDArray[np.intp]:
+        """The positions of the data points in `r` (in their original order), via bisection on the sorted index."""
+        if isinstance(r, RangeSet):
+            return np.sort(np.concatenate([self._window(x) for x in r] or [np.empty(0, np.intp)]))
+        return np.sort(self._window(r))
+
+    def _window(self, r: Range, /) -> NDArray[np.intp]:
+        x = self.sorted_bests
+        lo = np.searchsorted(x, r.left, side="left" if r.pleft == "[" else "right")
+        hi = np.searchsorted(x, r.right, side="right" if r.pright == "]" else "left")
+        return self.order[lo:max(lo, hi)]
+
+    def quantile(self, q: ArrayLike, /) -> Any:
+        """The `q`-th quantile(s) of the best values (with linear interpolation, like `numpy.quantile`)."""
+        x = self.sorted_bests
+        if not x.shape[0]:
+            raise ValueError("quantile() of an empty data set")
+        q = np.asarray(q, dtype=np.float64)
+        if not ((q >= 0) & (q <= 1)).all():
+            raise ValueError("Quantiles must be in the range [0, 1].")
+        pos = q * (x.shape[0] - 1)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.minimum(lo + 1, x.shape[0] - 1)
+        return scalar_or_array(x[lo] + (pos - lo)*(x[hi] - x[lo]))
+
     @property
     def min(self, /) -> X:
         return min(self.data, key=best)
@@ -93,7 +287,112 @@ class DataStats[X: MeasureLike[float]](AbstractStats, Protocol):
     @property
     @override
     def variance(self, /) -> float:
-        return sum([best(x)**2 for x in self.data])/self.n - self.average**2
+        avg = self.average
+        return sum([(best(x) - avg)**2 for x in self.data])/self.n
+
+
+@final
+@dataclass(slots=True, frozen=True)
+class Moments[X: MeasureLike[float]]:
+    """Summary statistics of some data."""
+    n: int
+    sum: float
+    variance: float
+    min: X | None
+    max: X | None
+
+    @property
+    def average(self, /) -> float:
+        return self.sum/self.n
+
+    @classmethod
+    def of[Y: MeasureLike[float]](cls, data: Iterable[Y], /) -> "Moments[Y]":
+        """Compute all the moments of `data` in a single pass."""
+        # Welford's algorithm: numerically stable, even with large offsets.
+        n, s, mean, m2 = 0, 0., 0., 0.
+        xmin = xmax = None
+        bmin, bmax = float("+inf"), float("-inf")
+        for x in data:
+            b = best(x)
+            n += 1
+            s += b
+            d = b - mean
+            mean += d/n
+            m2 += d*(b - mean)
+            if b < bmin or xmin is None:
+                bmin, xmin = b, x
+            if b > bmax or xmax is None:
+                bmax, xmax = b, x
+        return Moments(n, s, m2/n if n else 0., xmin, xmax)
+
+
+class Cached(Protocol):
+    """An immutable object that memoizes values derived from its contents."""
+    _cache: dict[str, Any]
+
+    def _cached[T](self, key: str, f: Callable[[Self], T], /) -> T:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = f(self)
+            return value
+
+
+class CachedDataStats[X: MeasureLike[float]](Cached, DataStats[X], Protocol):
+    """Statistics on immutable data, computed once and then cached."""
+
+    @property
+    def moments(self, /) -> Moments[X]:
+        return self._cached("moments", lambda self: Moments.of(self.data))
+
+    @property
+    @override
+    def n(self, /) -> int:
+        return self._cached("n", DataStats.n.fget)  # type: ignore
+
+    @property
+    @override
+    def bests(self, /) -> NDArray[np.float64]:
+        return self._cached("bests", DataStats.bests.fget)  # type: ignore
+
+    @property
+    @override
+    def order(self, /) -> NDArray[np.intp]:
+        return self._cached("order", DataStats.order.fget)  # type: ignore
+
+    @property
+    @override
+    def sorted_bests(self, /) -> NDArray[np.float64]:
+        return self._cached("sorted_bests", DataStats.sorted_bests.fget)  # type: ignore
+
+    @property
+    @override
+    def sum(self, /) -> float:
+        return self.moments.sum
+
+    @property
+    @override
+    def average(self, /) -> float:
+        return self.moments.average
+
+    @property
+    @override
+    def variance(self, /) -> float:
+        return self.moments.variance
+
+    @property
+    @override
+    def min(self, /) -> X:
+        if (x := self.moments.min) is None:
+            raise ValueError("min() of an empty data set")
+        return x
+
+    @property
+    @override
+    def max(self, /) -> X:
+        if (x := self.moments.max) is None:
+            raise ValueError("max() of an empty data set")
+        return x
 
 
 class ADataSet[X: MeasureLike[float]](DataSequence[X], DataStats[X], Measure[float], Protocol):
@@ -109,10 +408,21 @@ class ADataSet[X: MeasureLike[float]](DataSequence[X], DataStats[X], Measure[flo
     def delta(self, /) -> float:
         return self.sigma_avg
 
+    @overload
+    def __getitem__(self, key: int, /) -> X: ...
+    @overload
+    def __getitem__(self, key: slice | Range | RangeSet, /) -> Self: ...
+    @override
+    def __getitem__(self, key: int | slice | Range | RangeSet, /) -> X | Self:
+        if isinstance(key, Range | RangeSet):
+            # A view on the data points in the given range(s)
+            return type(self)(IndexView(self.data, self.window(key)))  # type: ignore
+        return super().__getitem__(key)
+
     # We have to re-define this because we don't have HKTs.
     @override
     def map[A: MeasureLike[float], B: MeasureLike[float]](self: "ADataSet[A]", f: Callable[[A], B], /) -> "ADataSet[B]":
         return super().map(f)  # type: ignore
 
 
-__all__ = ["DataSequence", "AbstractStats", "DataStats", "ADataSet"]
+__all__ = ["DataSequence", "IndexView", "SliceView", "MapView", "AbstractStats", "DataStats", "Moments", "Cached", "CachedDataStats", "ADataSet"]
@@ -1,28 +1,129 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """A concrete data set."""
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Sequence, final, override
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Self, Sequence, final, overload, override
 
-from .bins import ADataSet, BinSet
-from .measure import MeasureLike
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .bins import ABinSet, ADataSet
+from .data import CachedDataStats, Moments
+from .measure import Datum, MeasureArray, MeasureLike, best, delta
+from .range import Range, RangeSet
 
 
 @final
 @dataclass(slots=True, frozen=True)
-class DataSet[X: MeasureLike[float]](ADataSet[X]):
+class DataSet[X: MeasureLike[float]](CachedDataStats[X], ADataSet[X]):
     data: Sequence[X]  # pyright: ignore[reportIncompatibleMethodOverride]
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     if TYPE_CHECKING:
         # We have to re-define these methods because we don't have HKTs.
 
         @override
-        def intbins[T: MeasureLike[int]](self: "DataSet[T]", /) -> BinSet[T, "DataSet[T]"]:
-            return super().intbins()  # type: ignore
+        def intbins[T: MeasureLike[int]](self: "DataSet[T]", /, *, sparse: bool = False) -> ABinSet[T, "DataSet[T]"]:
+            return super().intbins(sparse=sparse)  # type: ignore
 
         @override
         def map[A: MeasureLike[float], B: MeasureLike[float]](self: "DataSet[A]", f: Callable[[A], B], /) -> "DataSet[B]":
             return super().map(f)  # type: ignore
 
 
-__all__ = ["DataSet"]
+@final
+@dataclass(slots=True, frozen=True, eq=False)
+class ArrayDataSet(CachedDataStats[Datum[float]], ADataSet[Datum[float]]):
+    """A columnar data set, backed by two contiguous `float64` arrays (best values and deltas).
+
+    The arrays are shared, not copied: do not mutate them after construction.
+    """
+    bests:  NDArray[np.float64]
+    deltas: NDArray[np.float64]
+    _cache: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __init__(self, bests: ArrayLike, deltas: ArrayLike | None = None, /) -> None:
+        b = np.ascontiguousarray(bests, dtype=np.float64)
+        if b.ndim != 1:
+            raise ValueError(f"ArrayDataSet expects 1D data, got shape {b.shape}.")
+        if deltas is None:
+            d = np.zeros_like(b)
+        else:
+            d = np.ascontiguousarray(np.broadcast_to(np.asarray(deltas, dtype=np.float64), b.shape))
+        object.__setattr__(self, "bests", b)
+        object.__setattr__(self, "deltas", d)
+        object.__setattr__(self, "_cache", {})
+
+    @classmethod
+    def of(cls, data: Iterable[MeasureLike[float]] | MeasureArray, /) -> Self:
+        """Convert any sequence of measures (or numbers) to columnar form."""
+        if isinstance(data, ArrayDataSet):
+            return cls(data.bests, data.deltas)
+        if isinstance(data, MeasureArray):
+            return cls(data.best, data.delta)
+        if not isinstance(data, Sequence):
+            data = tuple(data)
+        n = len(data)
+        return cls(
+            np.fromiter(map(best, data), np.float64, n),
+            np.fromiter(map(delta, data), np.float64, n),
+        )
+
+    @property
+    @override
+    def data(self, /) -> tuple[Datum[float], ...]:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return tuple(map(Datum, self.bests.tolist(), self.deltas.tolist()))
+
+    @property
+    def measures(self, /) -> MeasureArray:
+        """The data points, as a `MeasureArray` (for vectorized error propagation)."""
+        return MeasureArray(self.bests, self.deltas)
+
+    # --- Sequence ---
+
+    @override
+    def __len__(self, /) -> int:
+        return self.bests.shape[0]
+
+    @override
+    def __iter__(self, /) -> Iterator[Datum[float]]:
+        return map(Datum, self.bests.tolist(), self.deltas.tolist())
+
+    @overload
+    def __getitem__(self, key: int, /) -> Datum[float]: ...
+    @overload
+    def __getitem__(self, key: slice | Range | RangeSet | NDArray[np.intp] | NDArray[np.bool_], /) -> Self: ...
+    @override
+    def __getitem__(self, key: int | slice | Range | RangeSet | NDArray[np.intp] | NDArray[np.bool_], /) -> Datum[float] | Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if isinstance(key, int | np.integer):
+            return Datum(float(self.bests[key]), float(self.deltas[key]))
+        if isinstance(key, Range | RangeSet):
+            # The data points in the given range(s)
+            key = self.window(key)
+        # Slices are views; index arrays and masks select a copy.
+        return type(self)(self.bests[key], self.deltas[key])
+
+    @override
+    def map[B: MeasureLike[float]](self, f: Callable[[Datum[float]], B], /) -> "ArrayDataSet":  # pyright: ignore[reportIncompatibleMethodOverride]
+        return ArrayDataSet.of(map(f, self))
+
+    # --- Statistics ---
+
+    @property
+    @override
+    def n(self, /) -> int:
+        return self.bests.shape[0]
+
+    @property
+    @override
+    def moments(self, /) -> Moments[Datum[float]]:
+        return self._cached("moments", ArrayDataSet._moments)
+
+    def _moments(self, /) -> Moments[Datum[float]]:
+        b = self.bests
+        if not b.size:
+            return Moments(0, 0., 0., None, None)
+        return Moments(b.size, float(b.sum()), float(b.var()), self[int(b.argmin())], self[int(b.argmax())])
+
+
+__all__ = ["DataSet", "ArrayDataSet"]
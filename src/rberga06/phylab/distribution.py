@@ -1,11 +1,129 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from dataclasses import dataclass
-from math import ceil, floor
-from typing import Any, Protocol, Self, final, override
+from math import inf as oo
+from typing import Any, Callable, ClassVar, Protocol, Self, Sequence, final, overload, override
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._numerics import chi2_sf, scalar_or_array
 from .measure import Measure, MeasureLike
-from .data import ADataSet, AbstractStats
+from .data import ADataSet, AbstractStats, Cached
+from .bins import BinSet, IntBinSet
+from .dataset import ArrayDataSet
+
+
+type Seed = int | Sequence[int] | np.random.SeedSequence | np.random.Generator | None
+"""Anything that can seed a random number generator."""
+
+
+def spawn(seed: Seed, n: int, /) -> tuple[np.random.SeedSequence, ...]:
+    """Split `seed` into `n` independent (and reproducible) random streams, e.g. one per worker process."""
+    match seed:
+        case np.random.Generator():
+            return tuple(seed.bit_generator.seed_seq.spawn(n))  # type: ignore
+        case np.random.SeedSequence():
+            return tuple(seed.spawn(n))
+        case _:
+            return tuple(np.random.SeedSequence(seed).spawn(n))
+
+
+@final
+@dataclass(frozen=True, slots=True, eq=False)
+class ChiSquare:
+    """The result of Pearson's χ² goodness-of-fit test (arrays, in batch mode)."""
+    chi2: Any
+    """The χ² value."""
+    ndf: Any
+    """The number of degrees of freedom."""
+    p: Any
+    """The p-value, i.e. the probability of getting a χ² at least this large."""
+
+    @property
+    def chi2_ndf(self, /) -> Any:
+        """The reduced χ², i.e. `chi2/ndf`."""
+        return self.chi2/self.ndf
+
+
+def chi2_test(
+    observed: ArrayLike, expected: ArrayLike, /, *,
+    min_expected: float = 5.,
+    nparams: int = 0,
+) -> ChiSquare:
+    """Pearson's χ² test of `observed` counts against one (or many, stacked) rows of `expected` counts.
+
+    Adjacent bins are merged (greedily, left to right) until each group expects at least
+    `min_expected` counts; `nparams` is the number of parameters fitted on the data.
+    """
+    e = np.asarray(expected, dtype=np.float64)
+    batch = e.ndim > 1
+    e = np.atleast_2d(e)
+    o = np.broadcast_to(np.asarray(observed, dtype=np.float64), e.shape)
+    k = e.shape[0]
+    chi2, groups = np.zeros(k), np.zeros(k, dtype=np.intp)
+    acc_o, acc_e = np.zeros(k), np.zeros(k)     # the group being filled
+    last_o, last_e = np.zeros(k), np.zeros(k)   # the last complete group
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # One step per bin, for all the rows at once
+        for j in range(e.shape[1]):
+            acc_o += o[:, j]
+            acc_e += e[:, j]
+            done = acc_e >= min_expected
+            chi2 += np.where(done, np.square(acc_o - acc_e)/acc_e, 0.)
+            groups += done
+            last_o = np.where(done, acc_o, last_o)
+            last_e = np.where(done, acc_e, last_e)
+            acc_o = np.where(done, 0., acc_o)
+            acc_e = np.where(done, 0., acc_e)
+        # Merge what is left into the last complete group (or make it the only group)
+        left = (acc_e > 0) | (acc_o > 0)
+        merge = left & (groups > 0)
+        merged_o, merged_e = last_o + acc_o, last_e + acc_e
+        chi2 += np.where(merge, np.square(merged_o - merged_e)/merged_e - np.square(last_o - last_e)/last_e, 0.)
+        alone = left & (groups == 0)
+        chi2 = np.where(alone, np.square(acc_o - acc_e)/acc_e, chi2)
+        groups += alone
+    ndf = groups - 1 - nparams
+    p = np.where(ndf > 0, chi2_sf(chi2, np.maximum(ndf, 1)), np.nan)
+    if batch:
+        return ChiSquare(chi2, ndf, p)
+    return ChiSquare(float(chi2[0]), int(ndf[0]), float(p[0]))
+
+
+def _histogram(data: ADataSet[MeasureLike[float]], /) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+    """Bin edges and counts of `data` (which is binned automatically, if needed).
+
+    For an `IntBinSet`, each run of unoccupied values between two occupied ones becomes a single (empty) bin.
+    """
+    match data:
+        case BinSet():
+            return data.edges, data.counts
+        case IntBinSet():
+            edges = np.unique(np.concatenate([data.lefts, data.rights]))
+            counts = np.zeros(edges.size - 1, dtype=np.intp)
+            counts[np.searchsorted(edges, data.lefts)] = data.counts
+            return edges, counts
+        case _:
+            return _histogram(data.bins())  # type: ignore
+
+
+def chi2_scan(
+    data: ADataSet[MeasureLike[float]], dists: "Sequence[Distribution[Any]]", /, *,
+    min_expected: float = 5.,
+    nparams: int | None = None,
+) -> ChiSquare:
+    """Score `data` against many candidate distributions at once (see `chi2_test`)."""
+    edges, counts = _histogram(data)
+    if nparams is None:
+        nparams = type(dists[0]).nparams if dists else 0
+    if not dists:
+        expected = np.zeros((0, counts.size))
+    elif all(type(d) is type(dists[0]) for d in dists):
+        expected = type(dists[0]).expected_counts_many(dists, edges)
+    else:
+        expected = np.stack([d.expected_counts(edges) for d in dists])
+    return chi2_test(counts, expected, min_expected=min_expected, nparams=nparams)
 
 
 @final
@@ -15,10 +133,23 @@ class DistributionFit[D: "Distribution[Any]", S: ADataSet[MeasureLike[float]]]:
     dist: D
     data: S
 
+    def chi2(self, /, *, min_expected: float = 5., nparams: int | None = None) -> ChiSquare:
+        """Pearson's χ² goodness-of-fit test (see `chi2_test`).
+
+        Unless `data` is already binned, it is split into the default number of bins;
+        `nparams` defaults to the number of parameters estimated by `type(dist).fit`.
+        """
+        edges, counts = _histogram(self.data)
+        if nparams is None:
+            nparams = self.dist.nparams
+        return chi2_test(counts, self.dist.expected_counts(edges), min_expected=min_expected, nparams=nparams)
+
 
 class Distribution[T: float](AbstractStats, Measure[T], Protocol):
     """An (abstract) distribution."""
     n: int
+    nparams: ClassVar[int] = 0
+    """The number of parameters that `fit` estimates from the data."""
 
     @property
     @override
@@ -40,36 +171,78 @@ class Distribution[T: float](AbstractStats, Measure[T], Protocol):
     def delta(self, /) -> float:
         return self.sigma_avg
 
-    def pdf(self, x: T, /) -> float:
-        """The probability density function (PDF), evaluated at x."""
+    @overload
+    def pdf(self, x: T, /) -> float: ...
+    @overload
+    def pdf(self, x: NDArray[Any], /) -> NDArray[np.float64]: ...
+    def pdf(self, x: T | NDArray[Any], /) -> float | NDArray[np.float64]:
+        """The probability density function (PDF), evaluated at x (element-wise)."""
         ...
 
-    def p(self, x1: float, x2: float, /) -> float:
-        """The probability of getting something between x1 and x2."""
+    @overload
+    def cdf(self, x: float, /) -> float: ...
+    @overload
+    def cdf(self, x: ArrayLike, /) -> NDArray[np.float64]: ...
+    def cdf(self, x: ArrayLike, /) -> float | NDArray[np.float64]:
+        """The cumulative distribution function (CDF), evaluated at x (element-wise)."""
         ...
 
-    def p_worse(self, x: float, /) -> float:
-        """The probability of getting x, or worse."""
+    @overload
+    def p(self, x1: float, x2: float, /) -> float: ...
+    @overload
+    def p(self, x1: ArrayLike, x2: ArrayLike, /) -> NDArray[np.float64]: ...
+    def p(self, x1: ArrayLike, x2: ArrayLike, /) -> float | NDArray[np.float64]:
+        """The probability of getting something between x1 and x2 (element-wise)."""
+        return scalar_or_array(np.asarray(self.cdf(x2) - self.cdf(x1)))
+
+    @overload
+    def p_worse(self, x: float, /) -> float: ...
+    @overload
+    def p_worse(self, x: ArrayLike, /) -> NDArray[np.float64]: ...
+    def p_worse(self, x: ArrayLike, /) -> float | NDArray[np.float64]:
+        """The probability of getting x, or worse (i.e. at least as far from the average), element-wise."""
         ...
 
-    def chauvenet(self, x: T, /) -> bool:
-        """Check if we can apply Chauvenet to x."""
-        return (self.n * self.p_worse(x)) < .5
+    @overload
+    def chauvenet(self, x: T, /) -> bool: ...
+    @overload
+    def chauvenet(self, x: ArrayLike, /) -> NDArray[np.bool_]: ...
+    def chauvenet(self, x: ArrayLike, /) -> bool | NDArray[np.bool_]:
+        """Check if we can apply Chauvenet to x (element-wise)."""
+        return scalar_or_array(np.asarray(self.n * self.p_worse(x) < .5))
 
     def expected(self, x1: float, x2: float, /) -> float:
         """The expected value between `x1` and `x2`."""
         return self.p(x1, x2) * self.n
 
+    def expected_counts(self, edges: ArrayLike, /) -> NDArray[np.float64]:
+        """The expected counts in each of the bins delimited by `edges` (one CDF evaluation)."""
+        return np.diff(self.cdf(np.asarray(edges, dtype=np.float64))) * self.n
+
+    @classmethod
+    def expected_counts_many(cls, dists: Sequence[Self], edges: ArrayLike, /) -> NDArray[np.float64]:
+        """The expected counts of each of `dists` in the bins delimited by `edges`, as a `(len(dists), nbins)` array."""
+        edges = np.asarray(edges, dtype=np.float64)
+        return np.stack([d.expected_counts(edges) for d in dists])
+
     def bins(self, nbins: int, left: float, right: float, /) -> tuple[float, ...]:
         step = (right - left)/nbins
-        return tuple([self.expected(left+i*step, left+(i+1)*step) for i in range(nbins)])
+        return tuple(self.expected_counts(left + np.arange(nbins+1)*step).tolist())
 
     def intbins(self, left: int, right: int, /) -> tuple[float, ...]:
         return self.bins(right+1-left, left-.5, right+.5)
 
-    def sample(self, n: int, /) -> tuple[float, ...]:
-        """Return pseudo-random data with this distribution."""
-        raise NotImplementedError  # TODO: Implement this!
+    def sample(self, n: int, /, *, seed: Seed = None) -> ArrayDataSet:
+        """Return `n` pseudo-random data points with this distribution.
+
+        Use the same `seed` to reproduce a sample; to generate a large sample in parallel,
+        give each worker one of the independent streams returned by `spawn(seed, nworkers)`.
+        """
+        return ArrayDataSet(self._draw(np.random.default_rng(seed), n))
+
+    def _draw(self, rng: np.random.Generator, n: int, /) -> NDArray[np.float64]:
+        """Draw `n` values with this distribution, using `rng`."""
+        ...
 
     @classmethod
     def fit[S: ADataSet[MeasureLike[float]]](cls, data: S, /) -> DistributionFit[Self, S]:
@@ -77,10 +250,173 @@ class Distribution[T: float](AbstractStats, Measure[T], Protocol):
         ...
 
 
-class DiscreteDistribution(Distribution[int], Protocol):
+class DiscreteDistribution(Cached, Distribution[int], Protocol):
+    @property
+    def support_max(self, /) -> float:
+        """The largest possible value (the smallest one is 0)."""
+        return oo
+
+    @overload
+    def logpdf(self, x: int, /) -> float: ...
+    @overload
+    def logpdf(self, x: NDArray[Any], /) -> NDArray[np.float64]: ...
+    def logpdf(self, x: int | NDArray[Any], /) -> float | NDArray[np.float64]:
+        """The natural logarithm of the PDF, evaluated at x (element-wise); it never overflows."""
+        ...
+
+    @override
+    def pdf(self, x: int | NDArray[Any], /) -> float | NDArray[np.float64]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return scalar_or_array(np.exp(self.logpdf(x)))  # type: ignore
+
+    @classmethod
+    def _logpdf_many(cls, dists: Sequence[Self], k: NDArray[np.intp], /) -> NDArray[np.float64]:
+        """The `logpdf` of each of `dists`, at the natural numbers `k` (one row per distribution)."""
+        return np.stack([d.logpdf(k) for d in dists])
+
+    @classmethod
+    @override
+    def expected_counts_many(cls, dists: Sequence[Self], edges: ArrayLike, /) -> NDArray[np.float64]:
+        # All the CDFs at once, from a single (ndists, size) table (see `cdf`)
+        support_max = max(d.support_max for d in dists)
+        k = np.floor(np.minimum(np.asarray(edges, dtype=np.float64), support_max))
+        pdf, _ = _pdf_table(
+            lambda k: np.exp(cls._logpdf_many(dists, k)),
+            k[np.isfinite(k)].max(initial=-1), support_max, max(d.average for d in dists), 64,
+        )
+        table = np.concatenate([np.zeros((len(dists), 1)), np.cumsum(pdf, axis=1)], axis=1)
+        end = pdf.shape[1] - 1
+        cdf = table[:, np.clip(np.where(k < 0, -1, k), -1, end).astype(np.intp) + 1]
+        cdf = np.where(k > end, 1., cdf)
+        return np.diff(cdf, axis=1) * np.array([d.n for d in dists], dtype=np.float64)[:, None]
+
+    def pdf_table(self, kmax: float, /) -> NDArray[np.float64]:
+        """`table[k] == P(X == k)`, for `k = 0, 1, ...` up to (at least) `kmax`, or until the PDF underflows.
+
+        The table is cached; it is recomputed (twice as long each time) when a larger `kmax` is requested,
+        unless it is already complete. Past its end, the PDF is 0.
+        """
+        table: NDArray[np.float64] | None = self._cache.get("pdf_table")
+        if table is None or (table.size <= kmax and not self._cache["pdf_complete"]):
+            start = 64 if table is None else 2*table.size
+            table, self._cache["pdf_complete"] = _pdf_table(self.pdf, kmax, self.support_max, self.average, start)
+            self._cache["pdf_table"] = table
+            self._cache.pop("cdf_table", None)
+            self._cache.pop("sf_table", None)
+        return table
+
+    def cdf_table(self, kmax: float, /) -> NDArray[np.float64]:
+        """`table[k+1] == P(X <= k)`, for `k = -1, 0, ...` (see `pdf_table`); past its end, the CDF is 1."""
+        pdf = self.pdf_table(kmax)
+        table: NDArray[np.float64] | None = self._cache.get("cdf_table")
+        if table is None:
+            table = self._cache["cdf_table"] = np.concatenate([[0.], np.cumsum(pdf)])
+        return table
+
+    def sf_table(self, /) -> NDArray[np.float64]:
+        """`table[k+1] == P(X > k)`, for `k = -1, 0, ...` until the PDF underflows; past its end, it is 0.
+
+        The tail probabilities are summed from the upper end, so they stay accurate where they are tiny.
+        """
+        pdf = self.pdf_table(oo)
+        table: NDArray[np.float64] | None = self._cache.get("sf_table")
+        if table is None:
+            table = self._cache["sf_table"] = np.concatenate([np.cumsum(pdf[::-1])[::-1], [0.]])
+        return table
+
+    @override
+    def cdf(self, x: ArrayLike, /) -> float | NDArray[np.float64]:
+        k = np.floor(np.minimum(np.asarray(x, dtype=np.float64), self.support_max))
+        table = self.cdf_table(k[np.isfinite(k)].max(initial=-1))
+        end = table.size - 2
+        cdf = table[np.clip(np.where(k < 0, -1, k), -1, end).astype(np.intp) + 1]
+        return scalar_or_array(np.where(k > end, 1., cdf))
+
+    def sf(self, x: ArrayLike, /) -> float | NDArray[np.float64]:
+        """The survival function `P(X > x)`, evaluated at x (element-wise); unlike `1 - cdf(x)`, it is accurate in the upper tail."""
+        k = np.floor(np.minimum(np.asarray(x, dtype=np.float64), self.support_max))
+        table = self.sf_table()
+        end = table.size - 2
+        sf = table[np.clip(np.where(k < 0, -1, k), -1, end).astype(np.intp) + 1]
+        return scalar_or_array(np.where(k < 0, 1., np.where(k > end, 0., sf)))
+
     @override
-    def p(self, x1: float, x2: float, /) -> float:
-        return sum([*map(self.pdf, range(int(ceil(x1)), int(floor(x2))+1))])
+    def p(self, x1: ArrayLike, x2: ArrayLike, /) -> float | NDArray[np.float64]:
+        return scalar_or_array(np.asarray(self.cdf(x2) - self.cdf(np.ceil(x1) - 1)))
+
+    @override
+    def p_worse(self, x: ArrayLike, /) -> float | NDArray[np.float64]:
+        # P(X <= µ - d) + P(X >= µ + d)
+        µ = self.average
+        d = np.abs(np.asarray(x, dtype=np.float64) - µ)
+        p = self.cdf(µ - d) + self.sf(np.ceil(µ + d) - 1)
+        return scalar_or_array(np.clip(p, 0., 1.))
+
+
+def _pdf_table(
+    pdf: Callable[[NDArray[np.intp]], NDArray[np.float64]], kmax: float, support_max: float, average: float, size: int, /,
+) -> tuple[NDArray[np.float64], bool]:
+    """`pdf(np.arange(size))`, doubling `size` until it covers `kmax` or the whole (non-negligible) support.
+
+    Return the table and whether it is complete, i.e. whether the PDF is 0 past its end: either the support
+    ends there, or the PDF has underflowed past the average (beyond which it can only decrease).
+    """
+    while True:
+        size = int(min(size, support_max + 1))
+        table = pdf(np.arange(size))
+        complete = size > support_max or (size - 1 > average and not table[..., -1].any())
+        if complete or size > kmax:
+            return table, complete
+        size *= 2
+
+
+def _first_kept(dist: "Distribution[Any]", x: NDArray[np.float64], /) -> int:
+    """The position of the first value in `x` that would not be rejected by Chauvenet's criterion."""
+    # Only look at the first few values, then at twice as many, and so on.
+    start, size = 0, 16
+    while start < x.size:
+        block = x[start:start+size]
+        kept = np.flatnonzero(~dist.chauvenet(block))
+        if kept.size:
+            return start + int(kept[0])
+        start, size = start + size, 2*size
+    return x.size
+
+
+def chauvenet_filter[D: "Distribution[Any]"](
+    dist: type[D], data: ADataSet[MeasureLike[float]], /, *,
+    max_iter: int | None = None,
+    **fit_kwargs: Any,
+) -> tuple[DistributionFit[D, ArrayDataSet], NDArray[np.bool_]]:
+    """Iteratively reject outliers from `data` with Chauvenet's criterion.
+
+    At each iteration, `dist` is fit to the data that survived so far, and the points that
+    the criterion rejects are dropped; this is repeated until nothing changes (or for
+    at most `max_iter` iterations). Return the final fit (on the cleaned data) and the
+    rejection mask (`True` for each rejected point of `data`).
+    Raise `ValueError` if there is no data left to fit.
+    """
+    x, dx = data.bests, data.deltas
+    if not x.size:
+        raise ValueError("Cannot apply Chauvenet's criterion to an empty data set.")
+    order = np.argsort(x, kind="stable")
+    xs, dxs = x[order], dx[order]
+    # Since `p_worse` decreases with the distance from the average, the surviving points are
+    #   always a contiguous window of the sorted data: only its edges have to be checked.
+    lo, hi, it = 0, xs.size, 0
+    while max_iter is None or it < max_iter:
+        it += 1
+        fit = dist.fit(ArrayDataSet(xs[lo:hi], dxs[lo:hi]), **fit_kwargs)
+        new_lo = lo + _first_kept(fit.dist, xs[lo:hi])
+        new_hi = hi - _first_kept(fit.dist, xs[new_lo:hi][::-1])
+        if (new_lo, new_hi) == (lo, hi):
+            break
+        if new_lo >= new_hi:
+            raise ValueError("Chauvenet's criterion rejected every data point.")
+        lo, hi = new_lo, new_hi
+    rejected = np.ones(x.size, dtype=np.bool_)
+    rejected[order[lo:hi]] = False
+    cleaned = ArrayDataSet(x[~rejected], dx[~rejected])
+    return dist.fit(cleaned, **fit_kwargs), rejected
 
 
-__all__ = ["DistributionFit", "Distribution", "DiscreteDistribution"]
+__all__ = ["Seed", "spawn", "ChiSquare", "chi2_test", "chi2_scan", "DistributionFit", "Distribution", "DiscreteDistribution", "chauvenet_filter"]
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Forward-mode automatic differentiation (dual numbers) & exact first-order error propagation."""
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .measure import Datum, MeasureArray, MeasureLike, best, delta
+
+
+type _Partials = Mapping[int, Any]
+
+
+def _combine(a: _Partials, ca: Any, b: _Partials, cb: Any, /) -> dict[int, Any]:
+    """The partials of `ca*a + cb*b` (only the inputs that either depends on)."""
+    out = {i: ca*p for i, p in a.items()}
+    for i, p in b.items():
+        out[i] = out[i] + cb*p if i in out else cb*p
+    return out
+
+
+def _parts(x: "Dual | Any", /) -> tuple[Any, _Partials]:
+    if isinstance(x, Dual):
+        return x.value, x.partials
+    return x, {}
+
+
+@final
+@dataclass(slots=True, frozen=True, eq=False)
+class Dual:
+    """A value, together with its partial derivatives with respect to some independent inputs.
+
+    Partials are stored sparsely, as a mapping from the index of each input to the
+    derivative with respect to it: only actual dependencies are tracked. Values
+    (and derivatives) can be numbers or NumPy arrays.
+    """
+    value: Any
+    partials: _Partials
+
+    # Make NumPy defer to our reflected operators (e.g. `ndarray * Dual`)
+    __array_ufunc__ = None
+
+    @classmethod
+    def variable(cls, value: Any, index: int, /) -> "Dual":
+        """The `index`-th independent input."""
+        return cls(value, {index: 1.})
+
+    def gradient(self, n: int, /) -> NDArray[np.float64]:
+        """The (dense) partial derivatives with respect to inputs `0, ..., n-1`."""
+        grad = np.zeros((n, *np.shape(self.value)))
+        for i, p in self.partials.items():
+            grad[i] = p
+        return grad
+
+    # --- Unary operators ---
+
+    def __pos__(self, /) -> "Dual":
+        return self
+
+    def __neg__(self, /) -> "Dual":
+        return Dual(-self.value, {i: -p for i, p in self.partials.items()})
+
+    def __abs__(self, /) -> "Dual":
+        s = np.sign(self.value)
+        return Dual(abs(self.value), {i: s*p for i, p in self.partials.items()})
+
+    # --- Binary operators ---
+
+    def __add__(self, other: "Dual | Any", /) -> "Dual":
+        v, d = _parts(other)
+        return Dual(self.value + v, _combine(self.partials, 1., d, 1.))
+
+    def __sub__(self, other: "Dual | Any", /) -> "Dual":
+        v, d = _parts(other)
+        return Dual(self.value - v, _combine(self.partials, 1., d, -1.))
+
+    def __mul__(self, other: "Dual | Any", /) -> "Dual":
+        v, d = _parts(other)
+        return Dual(self.value * v, _combine(self.partials, v, d, self.value))
+
+    def __truediv__(self, other: "Dual | Any", /) -> "Dual":
+        v, d = _parts(other)
+        q = self.value / v
+        return Dual(q, _combine(self.partials, 1/v, d, -q/v))
+
+    def __pow__(self, other: "Dual | Any", /) -> "Dual":
+        v, d = _parts(other)
+        y = self.value ** v
+        # d(a^b) = b a^(b-1) da + a^b ln(a) db
+        dlog = np.log(self.value) * y if d else 0.
+        return Dual(y, _combine(self.partials, v * self.value ** (v - 1), d, dlog))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other: Any, /) -> "Dual":
+        return Dual(other - self.value, {i: -p for i, p in self.partials.items()})
+
+    def __rtruediv__(self, other: Any, /) -> "Dual":
+        q = other / self.value
+        return Dual(q, {i: -q/self.value*p for i, p in self.partials.items()})
+
+    def __rpow__(self, other: Any, /) -> "Dual":
+        y = other ** self.value
+        return Dual(y, {i: y*np.log(other)*p for i, p in self.partials.items()})
+
+    # --- Comparison (on values, so that formulas can branch) ---
+
+    def __lt__(self, other: "Dual | Any", /) -> Any:
+        return self.value < _parts(other)[0]
+
+    def __le__(self, other: "Dual | Any", /) -> Any:
+        return self.value <= _parts(other)[0]
+
+    def __gt__(self, other: "Dual | Any", /) -> Any:
+        return self.value > _parts(other)[0]
+
+    def __ge__(self, other: "Dual | Any", /) -> Any:
+        return self.value >= _parts(other)[0]
+
+
+def _lift(f: Callable[[Any], Any], df: Callable[[Any], Any], /) -> Callable[[Any], Any]:
+    """Extend `f` (with derivative `df`) to dual numbers."""
+    def lifted(x: Dual | Any, /) -> Any:
+        if isinstance(x, Dual):
+            d = df(x.value)
+            return Dual(f(x.value), {i: d*p for i, p in x.partials.items()})
+        return f(x)
+    lifted.__name__ = lifted.__qualname__ = f.__name__
+    lifted.__doc__ = f"`{f.__name__}`, for numbers, arrays and dual numbers."
+    return lifted
+
+
+# `math`-style functions, working on numbers, arrays and dual numbers
+sqrt = _lift(np.sqrt, lambda x: .5/np.sqrt(x))
+exp  = _lift(np.exp, np.exp)
+log  = _lift(np.log, lambda x: 1/x)
+log10 = _lift(np.log10, lambda x: 1/(x*np.log(10)))
+sin  = _lift(np.sin, np.cos)
+cos  = _lift(np.cos, lambda x: -np.sin(x))
+tan  = _lift(np.tan, lambda x: 1/np.cos(x)**2)
+asin = _lift(np.arcsin, lambda x: 1/np.sqrt(1 - x*x))
+acos = _lift(np.arccos, lambda x: -1/np.sqrt(1 - x*x))
+atan = _lift(np.arctan, lambda x: 1/(1 + x*x))
+sinh = _lift(np.sinh, np.cosh)
+cosh = _lift(np.cosh, np.sinh)
+tanh = _lift(np.tanh, lambda x: 1/np.cosh(x)**2)
+
+
+def propagate(
+    f: Callable[..., Any], /, *xs: MeasureLike[float] | MeasureArray,
+    use_delta_upper_bound: bool = False,
+) -> Datum[float] | MeasureArray:
+    """Evaluate `f(*xs)`, propagating the uncertainties on `xs` exactly to first order.
+
+    `f` is called once, with dual numbers in place of `xs`: it can be any Python formula
+    made of arithmetic operators and of the functions in this module. The partial
+    derivatives are combined in quadrature (or linearly, if `use_delta_upper_bound`).
+    """
+    y = f(*[Dual.variable(x.best if isinstance(x, MeasureArray) else best(x), i) for i, x in enumerate(xs)])
+    value, partials = _parts(y)
+    terms = [np.abs(p * (x.delta if isinstance(x, MeasureArray) else delta(x))) for p, x in ((p, xs[i]) for i, p in partials.items())]
+    if use_delta_upper_bound:
+        d = sum(terms, np.zeros(np.shape(value)))
+    else:
+        d = np.sqrt(sum([t*t for t in terms], np.zeros(np.shape(value))))
+    if np.ndim(value) or np.ndim(d):
+        return MeasureArray(*np.broadcast_arrays(value, d))
+    return Datum(float(value), float(d))
+
+
+__all__ = ["Dual", "propagate"]
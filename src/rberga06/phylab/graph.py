@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Deferred `Measure` arithmetic: expression graphs, evaluated in a single fused pass."""
+from dataclasses import dataclass
+from functools import wraps
+from inspect import signature
+from typing import Any, Callable, Iterable, Sequence, final
+
+import numpy as np
+
+from .measure import Datum, MeasureArray, _parts
+
+
+type _Node = tuple[Any, ...]
+"""`(op, *args)`, where args are node indices (or constants)."""
+
+
+@final
+class Graph:
+    """A DAG of `Measure` operations.
+
+    Nodes are hash-consed, so common subexpressions are only recorded (and evaluated) once.
+    Nodes are appended in topological order.
+    """
+    __slots__ = ("nodes", "_index", "_bound")
+    nodes: list[_Node]
+    _index: dict[_Node, int]
+    _bound: dict[int, Any]
+
+    def __init__(self, /) -> None:
+        self.nodes = []
+        self._index = {}
+        self._bound = {}
+
+    def _node(self, /, *node: Any) -> "Expr":
+        i = self._index.get(node)
+        if i is None:
+            i = self._index[node] = len(self.nodes)
+            self.nodes.append(node)
+        return Expr(self, i)
+
+    def var(self, name: str, /) -> "Expr":
+        """A free input, to be given a value at evaluation time."""
+        if not name.isidentifier():
+            raise ValueError(f"Not a valid input name: {name!r}")
+        return self._node("var", name)
+
+    def leaf(self, x: Any, /) -> "Expr":
+        """A known value: a number, an array, a `Measure` or a `MeasureArray`."""
+        if isinstance(x, Expr):
+            assert x.graph is self
+            return x
+        if isinstance(x, float | int):
+            return self._node("const", x)
+        expr = self._node("leaf", id(x))
+        self._bound[expr.index] = x  # (this also keeps `id(x)` valid)
+        return expr
+
+    def compile(self, /, *outputs: "Expr", inputs: Sequence[str] | None = None) -> "Program":
+        """Prepare the evaluation of `outputs` (only the nodes they depend on are kept).
+
+        The resulting `Program` takes `inputs` (by default, all the free inputs, in creation order).
+        """
+        needed: set[int] = set()
+        stack = [o.index for o in outputs]
+        while stack:
+            i = stack.pop()
+            if i not in needed:
+                needed.add(i)
+                op, *args = self.nodes[i]
+                if op not in ("var", "const", "leaf"):
+                    stack.extend(a for a in args if isinstance(a, int))
+        order = sorted(needed)
+        if inputs is None:
+            inputs = [name for op, name, *_ in self.nodes if op == "var"]
+        return Program(
+            tuple((i, *self.nodes[i]) for i in order),
+            {i: self._bound[i] for i in order if i in self._bound},
+            tuple(o.index for o in outputs),
+            tuple(inputs),
+        )
+
+    def eval(self, /, *outputs: "Expr", **values: Any) -> Any:
+        """Evaluate `outputs`, with the given values for the free inputs."""
+        return self.compile(*outputs)(**values)
+
+
+@final
+@dataclass(slots=True, frozen=True, eq=False)
+class Expr:
+    """A node in a `Graph`: operators record new nodes instead of computing anything."""
+    graph: Graph
+    index: int
+
+    # Make `Measure` and NumPy defer to our reflected operators
+    __array_ufunc__ = None
+
+    def _binary(self, op: str, other: Any, /, *, commutative: bool = False) -> "Expr":
+        a, b = self.index, self.graph.leaf(other).index
+        if commutative and b < a:
+            a, b = b, a
+        return self.graph._node(op, a, b)  # pyright: ignore[reportPrivateUsage]
+
+    def _rbinary(self, op: str, other: Any, /) -> "Expr":
+        return self.graph.leaf(other)._binary(op, self)
+
+    def eval(self, /, **values: Any) -> Any:
+        """Evaluate this expression."""
+        return self.graph.eval(self, **values)
+
+    def __pos__(self, /) -> "Expr":
+        return self
+
+    def __neg__(self, /) -> "Expr":
+        return self.graph._node("neg", self.index)  # pyright: ignore[reportPrivateUsage]
+
+    def __add__(self, other: Any, /) -> "Expr":
+        return self._binary("add", other, commutative=True)
+
+    def __sub__(self, other: Any, /) -> "Expr":
+        return self._binary("sub", other)
+
+    def __mul__(self, other: Any, /) -> "Expr":
+        return self._binary("mul", other, commutative=True)
+
+    def __truediv__(self, other: Any, /) -> "Expr":
+        return self._binary("div", other)
+
+    def __pow__(self, other: float, /) -> "Expr":
+        return self.graph._node("pow", self.index, float(other))  # pyright: ignore[reportPrivateUsage]
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other: Any, /) -> "Expr":
+        return self._rbinary("sub", other)
+
+    def __rtruediv__(self, other: Any, /) -> "Expr":
+        return self._rbinary("div", other)
+
+
+_CODE: dict[str, str] = {
+    "neg": "b{i}, d{i} = -b{0}, d{0}",
+    "add": "b{i}, d{i} = b{0} + b{1}, d{0} + d{1}",
+    "sub": "b{i}, d{i} = b{0} - b{1}, d{0} + d{1}",
+    "mul": "b{i}, d{i} = b{0} * b{1}, d{0}*abs(b{1}) + abs(b{0})*d{1}",
+    "div": "b{i} = b{0} / b{1}; d{i} = (d{0} + abs(b{i})*d{1}) / abs(b{1})",
+    "pow": "b{i} = b{0} ** _c{i}; d{i} = abs(b{i} * _c{i} / b{0}) * d{0}",
+}
+"""How each operation is evaluated (same rules as `Measure`)."""
+
+
+@final
+class Program:
+    """A compiled `Graph`: all of its nodes are evaluated in a single straight-line function."""
+    __slots__ = ("inputs", "source", "_run")
+    inputs: tuple[str, ...]
+    source: str
+    _run: Callable[..., tuple[tuple[Any, Any], ...]]
+
+    def __init__(
+        self, nodes: Iterable[tuple[Any, ...]], bound: dict[int, Any], outputs: tuple[int, ...], inputs: tuple[str, ...], /,
+    ) -> None:
+        self.inputs = inputs
+        namespace: dict[str, Any] = {"_parts": _parts}
+        lines = [f"def _run({''.join(f'_{k}, ' for k in range(len(inputs)))}/):"]
+        for i, op, *args in nodes:
+            match op:
+                case "var":
+                    lines.append(f"b{i}, d{i} = _parts(_{inputs.index(args[0])})")
+                case "const":
+                    # Constants are bound by name, as their `repr` might not be valid code
+                    namespace[f"_c{i}"] = args[0]
+                    lines.append(f"b{i}, d{i} = _c{i}, 0.")
+                case "leaf":
+                    # Bound values are read once, at compile time
+                    namespace[f"_b{i}"], namespace[f"_d{i}"] = _parts(bound[i])
+                    lines.append(f"b{i}, d{i} = _b{i}, _d{i}")
+                case "pow":
+                    namespace[f"_c{i}"] = args[1]
+                    lines.append(_CODE[op].format(*args, i=i))
+                case _:
+                    lines.append(_CODE[op].format(*args, i=i))
+        lines.append(f"return ({''.join(f'(b{o}, d{o}), ' for o in outputs)})")
+        self.source = "\n    ".join(lines)
+        exec(self.source, namespace)
+        self._run = namespace["_run"]
+
+    def __call__(self, /, *args: Any, **values: Any) -> Any:
+        """Evaluate, with the given values for the inputs (positionally and/or by name)."""
+        if values:
+            args = (*args, *[values[name] for name in self.inputs[len(args):]])
+        results = [_measure(b, d) for b, d in self._run(*args)]
+        return results[0] if len(results) == 1 else tuple(results)
+
+
+def _measure(best: Any, delta: Any, /) -> Datum[float] | MeasureArray:
+    if isinstance(best, np.ndarray) or isinstance(delta, np.ndarray):
+        return MeasureArray(*np.broadcast_arrays(best, delta))
+    return Datum(float(best), float(delta))
+
+
+def fuse[R](f: Callable[..., R], /) -> Callable[..., Any]:
+    """Trace `f` once (on free inputs named after its parameters) and evaluate it as a fused `Program` on each call.
+
+    `f` must be made of `Measure` arithmetic only: it cannot branch on the values of its arguments.
+    """
+    params = list(signature(f).parameters)
+    graph = Graph()
+    out: Any = f(*map(graph.var, params))
+    outputs = out if isinstance(out, tuple) else (out,)
+    program = graph.compile(*map(graph.leaf, outputs), inputs=params)  # pyright: ignore[reportUnknownArgumentType]
+    single = isinstance(out, tuple) and len(outputs) == 1
+
+    @wraps(f)
+    def fused(*args: Any, **kwargs: Any) -> Any:
+        result = program(*args, **kwargs)
+        return (result,) if single else result
+    return fused
+
+
+__all__ = ["Graph", "Expr", "Program", "fuse"]
@@ -5,6 +5,7 @@
 # pyright: reportIncompatibleVariableOverride=false
 """Histogram for Distributions."""
 from typing import Any, Literal, Sequence
+import numpy as np
 from manim import BarChart, Circle
 from manim.typing import Point3D
 from manim.constants import MED_SMALL_BUFF, DEFAULT_DOT_RADIUS
@@ -45,11 +46,11 @@ class DiscreteDistributionFitHistogram[F: DistributionFit[DiscreteDistribution,
         **kwargs: Any,
     ) -> None:
         self.fit = fit
-        dbins: list[tuple[int, float]] = [(int(b.center), len(b)) for b in fit.data.bins]
+        # Works for both dense and sparse (only occupied values) histograms.
         if bar_names == "auto":
-            bar_names = [str(b[0]) for b in dbins]
+            bar_names = [str(int(x)) for x in fit.data.centers.tolist()]
         super().__init__(
-            [b[1] for b in dbins],
+            fit.data.counts.tolist(),
             bar_names=bar_names,
             bar_colors=bar_colors,  # type: ignore
             **kwargs,
@@ -57,15 +58,14 @@ class DiscreteDistributionFitHistogram[F: DistributionFit[DiscreteDistribution,
 
     @property
     def fit_dist_bins(self, /) -> tuple[float, ...]:
-        return self.fit.dist.bins(
-            len(self.fit.data.bins),
-            self.fit.data.bins[ 0].left,
-            self.fit.data.bins[-1].right,
-        )
+        dist, data = self.fit.dist, self.fit.data
+        return tuple((dist.p(data.lefts, data.rights) * dist.n).tolist())
 
     def pt(self, x: float, y: float, /) -> Point3D:
         """Get the correct coordinates for a point in the graph."""
-        return self.coords_to_point(x-self.fit.data.bins[0].center+.5, y, 0)  # type: ignore
+        # Bars are drawn side by side, even if the (sparse) values are not contiguous.
+        i = float(np.interp(x, self.fit.data.centers, np.arange(self.fit.data.nbins)))
+        return self.coords_to_point(i+.5, y, 0)  # type: ignore
 
     def add_bar_labels(
         self,
@@ -89,8 +89,8 @@ class DiscreteDistributionFitHistogram[F: DistributionFit[DiscreteDistribution,
 
     def add_expected_dots(self, /) -> VGroup:
         self.expected_dots = VGroup(*[
-            Circle(DEFAULT_DOT_RADIUS).move_to(self.pt(i, h))
-            for i, h in enumerate(self.fit_dist_bins)
+            Circle(DEFAULT_DOT_RADIUS).move_to(self.pt(x, h))
+            for x, h in zip(self.fit.data.centers.tolist(), self.fit_dist_bins)
         ])
         self.add(self.expected_dots)
         return self.expected_dots
@@ -3,7 +3,15 @@
 # pyright: reportIncompatibleMethodOverride=false
 """Abstract measure."""
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Protocol, Self, cast, final, overload
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Protocol, Self, cast, final, overload
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+
+def _defers(x: object, /) -> bool:
+    """Whether `Measure` operators should leave `x` to its reflected operators (NumPy's convention)."""
+    return getattr(type(x), "__array_ufunc__", False) is None
 
 
 class Measure[X: (float, int)](Protocol):
@@ -36,6 +44,8 @@ class Measure[X: (float, int)](Protocol):
     @overload
     def __add__(self: "Measure[float]", other: "Measure[float] | Measure[int] | float | int", /) -> "Measure[float]": ...
     def __add__(self, other: "Measure[Any] | float", /) -> "Measure[Any]":
+        if _defers(other):
+            return NotImplemented
         if isinstance(other, float | int):
             return Datum(self.best + other, self.delta)
         return Datum(self.best + other.best, self.delta + other.delta)
@@ -52,11 +62,15 @@ class Measure[X: (float, int)](Protocol):
     @overload
     def __mul__(self: "Measure[float]", other: "Measure[float] | Measure[int] | float | int", /) -> "Measure[float]": ...
     def __mul__(self, other: "Measure[Any] | float", /) -> "Measure[Any]":
+        if _defers(other):
+            return NotImplemented
         if isinstance(other, float | int):
             return Datum(self.best * other, self.delta * abs(other))
         return Datum[X].from_delta_rel(self.best * other.best, self.delta_rel + other.delta_rel)
 
     def __truediv__(self, other: "Measure[float] | Measure[int] | float", /) -> "Measure[float]":
+        if _defers(other):
+            return NotImplemented
         if isinstance(other, float | int):
             return Datum(self.best / other, self.delta / abs(other))
         return Datum[float].from_delta_rel(self.best / other.best, self.delta_rel + other.delta_rel)
@@ -115,6 +129,131 @@ class Datum[X: (float, int)](Measure[X]):
         return cls(best, delta_rel * abs(best))
 
 
+type _Operand = MeasureArray | Measure[float] | Measure[int] | ArrayLike
+
+
+def _parts(x: _Operand, /) -> tuple[Any, Any]:
+    """Split `x` into its best value(s) and its delta(s)."""
+    if isinstance(x, MeasureArray | Datum):
+        return x.best, x.delta
+    if isinstance(x, float | int | np.ndarray):
+        return x, 0.
+    if hasattr(x, "best"):
+        return x.best, x.delta  # type: ignore
+    return np.asarray(x, dtype=np.float64), 0.
+
+
+def _isexact(x: _Operand, /) -> bool:
+    return isinstance(x, float | int | np.ndarray | np.number)
+
+
+@final
+@dataclass(slots=True, frozen=True, eq=False)
+class MeasureArray:
+    """An array of measures: operators act element-wise, with the same propagation rules as `Measure`.
+
+    Operands can be other `MeasureArray`s, scalar `Measure`s, numbers or arrays of numbers (broadcasting applies).
+    """
+    best:  NDArray[np.float64]
+    delta: NDArray[np.float64]
+
+    def __init__(self, best: ArrayLike, delta: ArrayLike = 0., /) -> None:
+        b = np.asarray(best, dtype=np.float64)
+        object.__setattr__(self, "best", b)
+        object.__setattr__(self, "delta", np.broadcast_to(np.asarray(delta, dtype=np.float64), b.shape))
+
+    # Make NumPy defer to our reflected operators (e.g. `ndarray * MeasureArray`)
+    __array_ufunc__ = None
+
+    @classmethod
+    def of(cls, data: "Iterable[MeasureLike[float]]", /) -> Self:
+        data = tuple(data)
+        return cls(np.fromiter(map(best, data), np.float64, len(data)), np.fromiter(map(delta, data), np.float64, len(data)))
+
+    @classmethod
+    def from_delta_rel(cls, best: ArrayLike, delta_rel: ArrayLike, /) -> Self:
+        return cls(best, np.multiply(delta_rel, np.abs(best)))
+
+    @property
+    def delta_rel(self, /) -> NDArray[np.float64]:
+        return self.delta / np.abs(self.best)
+
+    @property
+    def shape(self, /) -> tuple[int, ...]:
+        return self.best.shape
+
+    # --- Sequence ---
+
+    def __len__(self, /) -> int:
+        return len(self.best)
+
+    def __iter__(self, /) -> Iterator[Datum[float]]:
+        return map(Datum, self.best.tolist(), self.delta.tolist())
+
+    @overload
+    def __getitem__(self, key: int, /) -> Datum[float]: ...
+    @overload
+    def __getitem__(self, key: slice | NDArray[np.intp] | NDArray[np.bool_], /) -> "MeasureArray": ...
+    def __getitem__(self, key: int | slice | NDArray[np.intp] | NDArray[np.bool_], /) -> "Datum[float] | MeasureArray":
+        if isinstance(key, int | np.integer):
+            return Datum(float(self.best[key]), float(self.delta[key]))
+        return MeasureArray(self.best[key], self.delta[key])
+
+    # --- Unary operators ---
+
+    def __pos__(self, /) -> Self:
+        return self
+
+    def __neg__(self, /) -> "MeasureArray":
+        return MeasureArray(-self.best, self.delta)
+
+    # --- Binary operators ---
+
+    def __add__(self, other: _Operand, /) -> "MeasureArray":
+        b, d = _parts(other)
+        return MeasureArray(self.best + b, self.delta + d)
+
+    def __sub__(self, other: _Operand, /) -> "MeasureArray":
+        b, d = _parts(other)
+        return MeasureArray(self.best - b, self.delta + d)
+
+    def __mul__(self, other: _Operand, /) -> "MeasureArray":
+        b, d = _parts(other)
+        if _isexact(other):
+            return MeasureArray(self.best * b, self.delta * np.abs(b))
+        return MeasureArray.from_delta_rel(self.best * b, self.delta_rel + d/np.abs(b))
+
+    def __truediv__(self, other: _Operand, /) -> "MeasureArray":
+        b, d = _parts(other)
+        if _isexact(other):
+            return MeasureArray(self.best / b, self.delta / np.abs(b))
+        return MeasureArray.from_delta_rel(self.best / b, self.delta_rel + d/np.abs(b))
+
+    def __pow__(self, other: float, /) -> "MeasureArray":
+        return MeasureArray.from_delta_rel(self.best ** other, self.delta_rel * abs(other))
+
+    # --- Right operands ---
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __rsub__(self, other: _Operand, /) -> "MeasureArray":
+        b, d = _parts(other)
+        return MeasureArray(b - self.best, d + self.delta)
+
+    def __rtruediv__(self, other: _Operand, /) -> "MeasureArray":
+        b, d = _parts(other)
+        if _isexact(other):
+            return MeasureArray.from_delta_rel(b / self.best, self.delta_rel)
+        return MeasureArray.from_delta_rel(b / self.best, d/np.abs(b) + self.delta_rel)
+
+    # --- Comparison ---
+
+    def ε(self, other: _Operand, /) -> NDArray[np.float64]:
+        b, d = _parts(other)
+        return (self.best - b)/(self.delta + d)
+
+
 type MeasureLike[X: (float, int)] = Measure[X] | X
 
 
@@ -130,4 +269,4 @@ def delta[X: float](x: MeasureLike[X]) -> X:
     return x.delta
 
 
-__all__ = ["Measure", "MeasureLike", "Datum", "best", "delta"]
+__all__ = ["Measure", "MeasureLike", "Datum", "MeasureArray", "best", "delta"]
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Normal distribution."""
-from math import erf, exp, sqrt, pi
+from math import sqrt, pi
 from dataclasses import dataclass
-from typing import Self, final, override
+from typing import Any, ClassVar, Self, Sequence, final, override
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._numerics import erf, scalar_or_array
 from .data import ADataSet
 from .measure import MeasureLike
 from .distribution import Distribution, DistributionFit
@@ -16,6 +20,7 @@ class Gaussian(Distribution[float]):
     n: int
     µ: float
     s: float
+    nparams: ClassVar[int] = 2
 
     @property
     @override
@@ -28,16 +33,27 @@ class Gaussian(Distribution[float]):
         return self.s ** 2
 
     @override
-    def pdf(self, x: float) -> float:
-        return exp(-(((x-self.µ)/self.s)**2)/2)/(sqrt(2*pi)*self.s)
+    def pdf(self, x: ArrayLike) -> Any:
+        return scalar_or_array(np.exp(-np.square((np.asarray(x) - self.µ)/self.s)/2)/(sqrt(2*pi)*self.s))
+
+    @override
+    def cdf(self, x: ArrayLike) -> Any:
+        return scalar_or_array((1 + erf((np.asarray(x) - self.µ)/(self.s*sqrt(2))))/2)
 
     @override
-    def p(self, x1: float, x2: float) -> float:
-        return (erf((x2-self.µ)/self.s) - erf((x1-self.µ)/self.s))/2
+    def p_worse(self, x: ArrayLike) -> Any:
+        return scalar_or_array(1 - erf(np.abs(np.asarray(x) - self.µ)/(self.s*sqrt(2))))
+
+    @classmethod
+    @override
+    def expected_counts_many(cls, dists: Sequence[Self], edges: ArrayLike, /) -> NDArray[np.float64]:
+        n, µ, s = np.array([(d.n, d.µ, d.s) for d in dists], dtype=np.float64).T[..., None]
+        cdf = (1 + erf((np.asarray(edges, dtype=np.float64) - µ)/(s*sqrt(2))))/2
+        return np.diff(cdf, axis=1) * n
 
     @override
-    def p_worse(self, x: float) -> float:
-        return 1 - erf(abs(x - self.µ)/self.s)
+    def _draw(self, rng: np.random.Generator, n: int, /) -> NDArray[np.float64]:
+        return rng.normal(self.µ, self.s, n)
 
     @classmethod
     @override
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Poisson distribution."""
-from math import factorial, exp
-from dataclasses import dataclass
-from typing import Self, override
+from math import inf as oo
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Self, Sequence, override
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from ._numerics import gammainc, is_natural, log_factorial, scalar_or_array, xlogy
 from .measure import MeasureLike
 from .distribution import DiscreteDistribution, ADataSet, DistributionFit
 
@@ -13,6 +17,8 @@ from .distribution import DiscreteDistribution, ADataSet, DistributionFit
 class Poisson(DiscreteDistribution):
     n: int
     average: float  # pyright: ignore[reportIncompatibleMethodOverride]
+    nparams: ClassVar[int] = 1
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     @override
@@ -20,12 +26,30 @@ class Poisson(DiscreteDistribution):
         return self.average
 
     @override
-    def pdf(self, x: int) -> float:
-        return (pow(self.average, x) * exp(-self.average))/factorial(x)
+    def logpdf(self, x: ArrayLike) -> Any:
+        x = np.asarray(x, dtype=np.float64)
+        ok = is_natural(x)
+        k = np.where(ok, x, 0)
+        logp = xlogy(k, self.average) - self.average - log_factorial(k)
+        return scalar_or_array(np.where(ok, logp, -oo))
+
+    @override
+    def sf(self, x: ArrayLike, /) -> Any:
+        # P(X > k) = P(k+1, λ) (regularized lower incomplete gamma function)
+        k = np.floor(np.asarray(x, dtype=np.float64))
+        with np.errstate(invalid="ignore"):
+            sf = gammainc(np.maximum(k, 0) + 1, self.average)
+        return scalar_or_array(np.where(k < 0, 1., np.where(k == +oo, 0., sf)))
+
+    @classmethod
+    @override
+    def _logpdf_many(cls, dists: Sequence[Self], k: NDArray[np.intp], /) -> NDArray[np.float64]:
+        λ = np.array([d.average for d in dists], dtype=np.float64)[:, None]
+        return xlogy(k, λ) - λ - log_factorial(k)
 
     @override
-    def p_worse(self, x: float, /) -> float:
-        raise NotImplementedError  # TODO: Implement this
+    def _draw(self, rng: np.random.Generator, n: int, /) -> NDArray[np.float64]:
+        return rng.poisson(self.average, n).astype(np.float64)
 
     @classmethod
     @override
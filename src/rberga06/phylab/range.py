@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """A custom range type."""
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from math import inf as oo
-from typing import Literal, final, override
+from typing import Iterator, Literal, final, overload, override
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 
 def _infrepr(x: float, /) -> str:
@@ -91,7 +95,13 @@ class Range:
             case float() | int():  # [x] => [x; x]
                 return Range("[", x, x, "]")
 
-    def __and__(self, other: "Range", /) -> "Range":
+    @overload
+    def __and__(self, other: "Range", /) -> "Range": ...
+    @overload
+    def __and__(self, other: "RangeSet", /) -> "RangeSet": ...
+    def __and__(self, other: "Range | RangeSet", /) -> "Range | RangeSet":
+        if isinstance(other, RangeSet):
+            return other & self
         left, pleft = max(
             (self.left, self.pleft),
             (other.left, other.pleft),
@@ -104,7 +114,18 @@ class Range:
         )
         return Range(pleft, left, right, pright)
 
-    def __or__(self, other: "Range", /) -> "Range":
+    def __or__(self, other: "Range | RangeSet", /) -> "RangeSet":
+        """The union of `self` and `other` (see `hull` for the smallest `Range` containing both)."""
+        return RangeSet(self, other)
+
+    def __sub__(self, other: "Range | RangeSet", /) -> "RangeSet":
+        return RangeSet(self) - other
+
+    def __invert__(self, /) -> "RangeSet":
+        return ~RangeSet(self)
+
+    def hull(self, other: "Range", /) -> "Range":
+        """The smallest `Range` containing both `self` and `other`."""
         left, pleft = min(
             (self.left, self.pleft),
             (other.left, other.pleft),
@@ -134,12 +155,26 @@ class Range:
 
     def split(self, n: int, /) -> tuple["Range", ...]:
         """Split this range into `n` smaller ones."""
-        dx = (self.right - self.left)/n
-        ranges = [Range("(", self.left+i*dx, self.left+(i+1)*dx, "]") for i in range(n)]
+        edges = self.edges(n).tolist()
+        ranges = [Range("(", left, right, "]") for left, right in zip(edges[:-1], edges[1:])]
         object.__setattr__(ranges[0],  "pleft",  self.pleft)
         object.__setattr__(ranges[-1], "pright", self.pright)
         return tuple(ranges)
 
+    def edges(self, n: int, /) -> NDArray[np.float64]:
+        """The `n + 1` edges of `n` equal bins spanning this range (see `BinSet.of`)."""
+        if not np.isfinite([self.left, self.right]).all():
+            raise ValueError(f"Cannot split an infinite range: {self}.")
+        return np.linspace(self.left, self.right, n + 1)
+
+    def mask(self, x: ArrayLike, /) -> NDArray[np.bool_]:
+        """Which elements of `x` lie in this range (vectorized `in`)."""
+        x = np.asarray(x)
+        return (
+            (x >= self.left if self.pleft == "[" else x > self.left)
+            & (x <= self.right if self.pright == "]" else x < self.right)
+        )
+
     # --- Python standard methods ---
 
     @override
@@ -164,16 +199,127 @@ class Range:
         return True
 
     def __bool__(self, /) -> bool:
-        if self.left > self.right:
-            return False
-        if self.left < self.right:
-            return True
-        if self.pleft == "(" and self.pright == ")":
-            return False
-        return True
+        # Only '[x; x]' is non-empty among the degenerate ones
+        lo, hi = _cuts(self)
+        return lo < hi
+
+
+type _Cut = tuple[float, int]
+"""An endpoint, as a position between real numbers: `(x, -1)` is just before `x`, `(x, +1)` just after."""
+
+
+def _cuts(r: Range, /) -> tuple[_Cut, _Cut]:
+    return (r.left, -1 if r.pleft == "[" else 1), (r.right, 1 if r.pright == "]" else -1)
+
+
+def _range(lo: _Cut, hi: _Cut, /) -> Range:
+    return Range("[" if lo[1] < 0 else "(", lo[0], hi[0], "]" if hi[1] > 0 else ")")
+
+
+@final
+@dataclass(slots=True, frozen=True)
+class RangeSet:
+    """A union of `Range`s, stored as sorted, disjoint (and non-adjacent) intervals."""
+    ranges: tuple[Range, ...]
+    _lefts: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __init__(self, /, *ranges: "Range | RangeSet") -> None:
+        cuts = sorted(c for x in ranges for r in (x.ranges if isinstance(x, RangeSet) else (x,)) if (c := _cuts(r))[0] < c[1])
+        # Sweep, merging overlapping or adjacent intervals
+        merged: list[list[_Cut]] = []
+        for lo, hi in cuts:
+            if merged and lo <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], hi)
+            else:
+                merged.append([lo, hi])
+        self._set([_range(lo, hi) for lo, hi in merged])
+
+    @classmethod
+    def _of(cls, ranges: list[Range], /) -> "RangeSet":
+        """Wrap `ranges`, which must already be sorted, disjoint and non-adjacent."""
+        self = object.__new__(cls)
+        self._set(ranges)
+        return self
+
+    def _set(self, ranges: list[Range], /) -> None:
+        object.__setattr__(self, "ranges", tuple(ranges))
+        object.__setattr__(self, "_lefts", tuple([r.left for r in ranges]))
+
+    # --- Set algebra ---
+
+    def __or__(self, other: "Range | RangeSet", /) -> "RangeSet":
+        return RangeSet(self, other)
+
+    def __and__(self, other: "Range | RangeSet", /) -> "RangeSet":
+        a = [_cuts(r) for r in self.ranges]
+        b = [c for r in (other.ranges if isinstance(other, RangeSet) else (other,)) if (c := _cuts(r))[0] < c[1]]
+        # Sweep both (sorted) lists at once
+        out: list[Range] = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            lo, hi = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+            if lo < hi:
+                out.append(_range(lo, hi))
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+        return RangeSet._of(out)
+
+    def __invert__(self, /) -> "RangeSet":
+        cuts = [c for r in self.ranges for c in _cuts(r)]
+        bounds = [(-oo, 1), *cuts, (+oo, -1)]
+        # The gaps between consecutive intervals
+        return RangeSet._of([_range(lo, hi) for lo, hi in zip(bounds[::2], bounds[1::2]) if lo < hi])
+
+    def __sub__(self, other: "Range | RangeSet", /) -> "RangeSet":
+        return self & ~RangeSet(other)
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+    def __rsub__(self, other: Range, /) -> "RangeSet":
+        return RangeSet(other) - self
+
+    # --- Membership ---
+
+    def __contains__(self, x: float, /) -> bool:
+        i = bisect_right(self._lefts, x) - 1
+        return i >= 0 and x in self.ranges[i]
+
+    def mask(self, x: ArrayLike, /) -> NDArray[np.bool_]:
+        """Which elements of `x` lie in this set (vectorized `in`): O(n log k)."""
+        x = np.asarray(x)
+        if not self.ranges:
+            return np.zeros(x.shape, np.bool_)
+        # All the endpoints, in order, and whether each of them is included
+        bounds = np.array([y for r in self.ranges for y in (r.left, r.right)])
+        closed = np.array([p in "[]" for r in self.ranges for p in (r.pleft, r.pright)])
+        i = np.searchsorted(bounds, x, side="right")
+        # Between a left endpoint and a right one
+        inside = (i & 1).astype(np.bool_)
+        # On an endpoint: it depends on the parenthesis
+        on = np.flatnonzero(bounds[i-1] == x)
+        inside[on] = closed[i[on] - 1]
+        return inside
+
+    # --- Python standard methods ---
+
+    def __len__(self, /) -> int:
+        return len(self.ranges)
+
+    def __iter__(self, /) -> Iterator[Range]:
+        return iter(self.ranges)
+
+    def __bool__(self, /) -> bool:
+        return bool(self.ranges)
+
+    @override
+    def __repr__(self, /) -> str:
+        return " ∪ ".join(map(repr, self.ranges)) if self.ranges else "∅"
 
 
 R = Range()
 
 
-__all__ = ["Range", "R"]
+__all__ = ["Range", "RangeSet", "R"]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# pyright: reportIncompatibleVariableOverride=false
+"""Streaming (online) statistics."""
+from dataclasses import dataclass, replace
+from math import inf as oo
+from typing import Iterable, Self, final, override
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .measure import MeasureLike, best
+from .data import AbstractStats
+
+
+@final
+@dataclass(slots=True)
+class StreamingStats(AbstractStats):
+    """Running statistics on a stream of readings, in O(1) memory.
+
+    Moments are updated with Welford's algorithm (one reading at a time)
+    and combined with Chan's formula (chunks and `merge`), so the variance
+    stays accurate even on long runs with a large offset.
+    """
+    n: int = 0
+    mean: float = 0.
+    m2: float = 0.
+    """Sum of squared deviations from the mean."""
+    min: float = +oo
+    max: float = -oo
+
+    @classmethod
+    def of(cls, data: Iterable[MeasureLike[float]] | ArrayLike, /) -> Self:
+        return cls().extend(data)
+
+    def push(self, x: MeasureLike[float], /) -> Self:
+        """Add a single reading."""
+        b = best(x)
+        self.n += 1
+        d = b - self.mean
+        self.mean += d/self.n
+        self.m2 += d*(b - self.mean)
+        if b < self.min:
+            self.min = b
+        if b > self.max:
+            self.max = b
+        return self
+
+    def extend(self, data: Iterable[MeasureLike[float]] | ArrayLike, /) -> Self:
+        """Add a chunk of readings."""
+        if isinstance(data, np.ndarray):
+            a = np.asarray(data, dtype=np.float64).ravel()
+        else:
+            a = np.fromiter(map(best, data), np.float64)  # pyright: ignore[reportArgumentType]
+        if not a.size:
+            return self
+        mean = float(a.mean())
+        chunk = type(self)(a.size, mean, float(np.square(a - mean).sum()), float(a.min()), float(a.max()))
+        return self.merge(chunk)
+
+    def merge(self, *others: "StreamingStats") -> Self:
+        """Combine the partial results of `others` into `self`."""
+        for other in others:
+            if not other.n:
+                continue
+            n = self.n + other.n
+            d = other.mean - self.mean
+            self.mean += d*other.n/n
+            self.m2 += other.m2 + d*d*self.n*other.n/n
+            self.n = n
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    def __add__(self, other: "StreamingStats", /) -> "StreamingStats":
+        return replace(self).merge(other)
+
+    @property
+    @override
+    def sum(self, /) -> float:
+        return self.mean*self.n
+
+    @property
+    @override
+    def average(self, /) -> float:
+        return self.mean
+
+    @property
+    @override
+    def variance(self, /) -> float:
+        return self.m2/self.n
+
+
+__all__ = ["StreamingStats"]
@@ -1,9 +1,12 @@
 # pyright: reportIncompatibleMethodOverride=false
 # pyright: reportUnknownMemberType=false
-from collections.abc import Sequence, Mapping
-from typing import Any, TypedDict, Unpack, cast
-from sympy import Expr, Symbol, Rational
-from .measure import Measure, Datum
+from collections.abc import Callable, Sequence, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, TypedDict, Unpack, cast, final
+import numpy as np
+from sympy import Expr, Symbol, Rational, lambdify, sqrt
+from .measure import Measure, MeasureArray, Datum, best, delta
 
 
 class SympyAssumptions(TypedDict, total=False):
@@ -84,6 +87,23 @@ def _evalf(expr: Expr, subs: Mapping[Symbol, float | Measure[float]], kwargs: _E
     return expr.evalf(**kwargs)
 
 
+def _inputs(expr: Expr, /) -> tuple[Symbol, ...]:
+    """The free symbols of `expr`, in a deterministic order."""
+    return tuple(sorted(expr.atoms(Symbol), key=lambda x: x.name))
+
+
+def _delta_symbol(x: Symbol, /) -> Symbol:
+    if isinstance(x, MeasureSymbol):
+        return x.measure_delta_symbol()
+    return Symbol(f"delta[{x.name}]", **cast(SympyAssumptions, x.assumptions0))
+
+
+@lru_cache(maxsize=256)
+def _delta_expr(expr: Expr, /) -> Expr:
+    """The (first-order) propagated uncertainty on `expr`, in terms of `delta[...]` symbols."""
+    return sqrt(sum([expr.diff(x)**2 * _delta_symbol(x)**2 for x in _inputs(expr)]))  # type: ignore
+
+
 def evalf(expr: Expr, /, use_delta_upper_bound: bool = False, **kwargs: Unpack[_EvalfKwArgs]) -> Measure[float]:
     symbols = expr.atoms(Symbol)
     measure_subs = {x: x.measure for x in symbols if isinstance(x, MeasureSymbol) and x.measure is not None}
@@ -91,11 +111,67 @@ def evalf(expr: Expr, /, use_delta_upper_bound: bool = False, **kwargs: Unpack[_
         return _evalf(expr, measure_subs, kwargs)  # type: ignore
     else:
         best: float = _evalf(expr, {x: m.best for x, m in measure_subs.items()}, kwargs)
-        delta: float = _evalf(
-            sum([abs(expr.diff(x))**2 * abs(x.measure_delta_symbol()) for x in measure_subs]) ** Rational(1, 2),  # type: ignore
-            {x.measure_delta_symbol(): m.delta for x, m in measure_subs.items()}, kwargs
-        )
+        # Symbols without a measure attached are exact
+        delta_subs = {_delta_symbol(x): 0. for x in symbols} | {_delta_symbol(x): m.delta for x, m in measure_subs.items()}
+        delta: float = _evalf(_delta_expr(expr), {**{x: m.best for x, m in measure_subs.items()}, **delta_subs}, kwargs)
         return Datum(best, delta)
 
 
-__all__ = ["symbol", "symbols", "evalf"]
+type _Value = float | Measure[float] | MeasureArray | Any
+
+
+@final
+@dataclass(frozen=True, slots=True, eq=False)
+class CompiledExpr:
+    """An expression, compiled to NumPy kernels for its value and for its propagated uncertainty."""
+    expr: Expr
+    inputs: tuple[Symbol, ...]
+    _best: Callable[..., Any]
+    _delta: Callable[..., Any]
+
+    def __call__(self, values: Mapping[Symbol, _Value] | None = None, /) -> Datum[float] | MeasureArray:
+        """Evaluate the expression on `values` (by default, on the `measure`s attached to the symbols).
+
+        Values can be numbers, measures, or (for batch evaluation) `MeasureArray`s and data sets
+        with array `bests`/`deltas`: the result is then a `MeasureArray`, with the broadcast shape.
+        """
+        values = values or {}
+        bests: list[Any] = []
+        deltas: list[Any] = []
+        for x in self.inputs:
+            v = values.get(x)
+            if v is None and isinstance(x, MeasureSymbol):
+                v = x.measure
+            if v is None:
+                raise ValueError(f"No value for symbol {x}.")
+            if hasattr(v, "bests"):  # a data set
+                bests.append(v.bests)  # type: ignore
+                deltas.append(v.deltas)  # type: ignore
+            else:
+                bests.append(best(v))  # type: ignore
+                deltas.append(delta(v))  # type: ignore
+        b, d = self._best(*bests), self._delta(*bests, *deltas)
+        if np.ndim(b) or np.ndim(d):
+            b, d = np.broadcast_arrays(b, d)
+            return MeasureArray(b, d)
+        return Datum(float(b), float(d))
+
+
+@lru_cache(maxsize=256)
+def compiled(expr: Expr, /) -> CompiledExpr:
+    """Compile `expr` (differentiating it only once); the result is cached, keyed by expression."""
+    inputs = _inputs(expr)
+    deltas = [_delta_symbol(x) for x in inputs]
+    return CompiledExpr(
+        expr, inputs,
+        lambdify(inputs, expr, modules="numpy"),
+        lambdify([*inputs, *deltas], _delta_expr(expr), modules="numpy"),
+    )
+
+
+def evalf_batch(expr: Expr, values: Mapping[Symbol, _Value] | None = None, /) -> Datum[float] | MeasureArray:
+    """Evaluate `expr` and its uncertainty with compiled NumPy kernels (see `CompiledExpr`)."""
+    return compiled(expr)(values)
+
+
+__all__ = ["symbol", "symbols", "evalf", "CompiledExpr", "compiled", "evalf_batch"]
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.bernoulli"""
+from math import comb, isclose
+import numpy as np
+from rberga06.phylab.bernoulli import Bernoulli
+
+
+class TestBernoulli:
+    def test_pdf(self, /) -> None:
+        d = Bernoulli(100, 10, .3)
+        ref = [comb(10, k) * .3**k * .7**(10-k) for k in range(11)]
+        assert np.allclose(d.pdf(np.arange(11)), ref)
+        assert d.pdf(11) == d.pdf(-1) == d.pdf(.5) == 0
+        assert isclose(d.p(-np.inf, np.inf), 1) and isclose(d.cdf(10), 1)
+
+    def test_large(self, /) -> None:
+        d = Bernoulli(100, 4000, .5)
+        assert isclose(d.pdf(2000), comb(4000, 2000) / 2**4000)
+        assert isclose(d.p(2000, 4000), .5 + d.pdf(2000)/2)
+        # Upper tail, summed directly
+        assert isclose(d.sf(2400), sum(comb(4000, k) for k in range(2401, 4001)) / 2**4000, rel_tol=1e-9)
+        assert d.sf(4000) == 0. and d.sf(-1) == 1.
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.bins"""
+import numpy as np
+from rberga06.phylab.bins import BinSet, IntBinSet, group, histogram
+from rberga06.phylab.dataset import ArrayDataSet, DataSet
+from rberga06.phylab.measure import best
+from rberga06.phylab.poisson import Poisson
+from rberga06.phylab.range import R
+
+
+class TestBins:
+    def test_histogram(self, /) -> None:
+        x = np.array([.5, 3., -1., 0., 2.9, 1., 7., 1.5])
+        assert histogram(x, 0., 3., 3).tolist() == [2, 2, 2]
+        assert group(x, 0., 3., 3).tolist() == [0, 3, 5, 7, 1, 4]
+
+    def test_bins(self, /) -> None:
+        data = [.5, 3., -1., 0., 2.9, 1., 7., 1.5]
+        for ds in DataSet(data), ArrayDataSet(data):
+            bins = ds.bins(3, left=0., right=3.).bins
+            assert [(b.left, b.right) for b in bins] == [(0., 1.), (1., 2.), (2., 3.)]
+            assert [[best(x) for x in b.data] for b in bins] == [[.5, 0.], [1., 1.5], [3., 2.9]]
+            assert [b.n for b in ds.bins().bins] == [6, 2]
+            assert BinSet.of(ds, R[0:3].edges(3)).counts.tolist() == [2, 2, 2]
+        # The last edge must be exactly the maximum, or it would be left out
+        l, r = -9.328288493890714, -2.0290305840555725
+        rng = np.random.default_rng(0)
+        for ds in [DataSet([l, (l + r)/2, r]), *(ArrayDataSet(rng.normal(size=3)) for _ in range(200))]:
+            for k in (7, 43, 100):
+                assert ds.bins(k).n == ds.n
+
+    def test_binset(self, /) -> None:
+        data = [0]*12+[1]*10+[2]*7+[3]*5+[4]*1
+        bins = ArrayDataSet(data).intbins()
+        assert bins.counts.tolist() == [b.n for b in bins.bins] == [12, 10, 7, 5, 1]
+        assert bins.edges.tolist() == [-.5, .5, 1.5, 2.5, 3.5, 4.5]
+        assert bins.n == 35 and (bins.min, bins.max) == (0., 4.)
+        ds = DataSet(sorted(data))
+        assert bins.data == tuple(ds.data) and bins.sum == ds.sum
+        assert abs(bins.variance - ds.variance) < 1e-12
+        assert DataSet([]).bins().n == 0
+
+    def test_intbins_sparse(self, /) -> None:
+        data = [0]*12+[1]*10+[2]*7+[3]*5+[4]*1+[10**6]
+        bins = ArrayDataSet(data).intbins(sparse=True)
+        assert isinstance(bins, IntBinSet)
+        assert bins.values.tolist() == [0, 1, 2, 3, 4, 10**6]
+        assert bins.counts.tolist() == [b.n for b in bins.bins] == [12, 10, 7, 5, 1, 1]
+        assert bins.bins[-1].left == 10**6 - .5
+        dense = DataSet(data[:-1]).intbins()
+        assert isinstance(dense, BinSet) and isinstance(ArrayDataSet(data).intbins(), BinSet)
+        assert DataSet(data[:-1]).intbins(sparse=True).moments == dense.moments
+        assert Poisson.fit(bins).dist.average == DataSet(data).average
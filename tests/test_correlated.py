@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.correlated"""
+from math import cos, hypot, isclose, sin, sqrt
+import numpy as np
+from rberga06.phylab import constants, dual
+from rberga06.phylab.correlated import Correlated, correlation, covariance, independent, independents
+from rberga06.phylab.measure import Datum
+
+
+class TestCorrelated:
+    def test_ops(self, /) -> None:
+        g = independent(constants.g)
+        assert (g - g).delta == 0. and ((2*g)/g).delta == 0.
+        assert isclose((g*g).delta, 2*g.best*g.delta)
+        x = independent(Datum(2., .1))
+        y = x*g + Datum(1., .2)
+        assert isinstance(y, Correlated) and isinstance(Datum(1., .2) + y, Correlated)
+        assert isclose(y.best, 2*9.806 + 1)
+        assert isclose(y.delta, hypot(9.806*.1, 2*.001, .2))
+        s = x.apply(dual.sin)
+        assert isclose(s.best, sin(2.)) and isclose(s.delta, abs(cos(2.))*.1)
+        assert (1 / x).datum == Datum(.5, .025)
+
+    def test_reuse(self, /) -> None:
+        # A plain measure used several times is the same input
+        x = independent(Datum(2., .1))
+        y = x*constants.g - constants.g
+        assert len(y.components) == 2
+        assert isclose(y.delta, hypot(9.806*.1, (2. - 1.)*.001))
+        assert (constants.g - independent(constants.g)).delta == 0.
+        assert (independent(Datum(1., .1)) - Datum(1., .1)).delta == .1*sqrt(2)
+        a, b = independents([constants.g, constants.g])
+        assert a.components == b.components
+
+    def test_covariance(self, /) -> None:
+        a, b = independents([Datum(1., .1), Datum(2., .2)])
+        cov = covariance(a + b, a - b, b)._np
+        assert np.allclose(cov, [[.05, -.03, .04], [-.03, .05, -.04], [.04, -.04, .04]])
+        corr = correlation(a, 3*a, b)._np
+        assert np.allclose(corr, [[1., 1., 0.], [1., 1., 0.], [0., 0., 1.]])
+        assert a.cov(b) == 0.
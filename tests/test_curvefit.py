@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.curvefit"""
+import math
+import warnings
+import numpy as np
+import pytest
+from rberga06.phylab.curvefit import ConvergenceWarning, curve_fit, linear_fit, polyfit
+from rberga06.phylab.dataset import ArrayDataSet
+from rberga06.phylab.measure import MeasureArray
+
+
+class TestLinearFit:
+    def test_weighted(self, /) -> None:
+        rng = np.random.default_rng(0)
+        x = np.arange(10.)
+        y = MeasureArray(2*x + 1 + rng.normal(0., .5, 10), .5)
+        fit = polyfit(x, y, 1)
+        p, cov = np.polyfit(x, y.best, 1, w=1/y.delta, cov="unscaled")
+        assert np.allclose([q.best for q in fit.params], p[::-1])
+        assert np.allclose(fit.cov._np, cov[::-1, ::-1])
+        assert fit.chi2.ndf == 8 and 0 < fit.chi2.p < 1
+        same = linear_fit(ArrayDataSet(x), ArrayDataSet(y.best, y.delta), [lambda x: 1., lambda x: x])
+        assert same.params == fit.params
+
+    def test_unweighted(self, /) -> None:
+        x = np.arange(8.)
+        y = np.array([.1, 1.2, 1.9, 3.2, 3.9, 5.1, 6., 6.8])
+        fit = polyfit(x, y, 1)
+        _, cov = np.polyfit(x, y, 1, cov=True)
+        assert np.allclose(fit.cov._np, cov[::-1, ::-1])
+        with pytest.raises(ValueError):
+            polyfit(x, MeasureArray(y, np.r_[0., np.ones(7)]), 1)
+        # Not enough points to estimate the errors (or the parameters)
+        exact = polyfit(x[:2], y[:2], 1)
+        assert np.allclose([p.best for p in exact.params], [.1, 1.1])
+        assert all(p.delta == np.inf for p in exact.params) and exact.chi2.ndf == 0
+        with pytest.raises(ValueError):
+            polyfit(x[:2], y[:2], 2)
+
+    def test_batch(self, /) -> None:
+        rng = np.random.default_rng(1)
+        x = np.arange(10.)
+        y = MeasureArray(3*x - 2 + rng.normal(0., 1., (500, 10)), 1.)
+        fit = polyfit(x, y, 2)
+        assert isinstance(fit.params, MeasureArray) and fit.params.shape == (500, 3)
+        assert fit.cov.shape == (500,) and fit.chi2.chi2.shape == (500,)
+        one = polyfit(x, MeasureArray(y.best[7], y.delta[7]), 2)
+        assert np.allclose(fit.params.best[7], [p.best for p in one.params])
+        assert np.allclose(fit.params.delta[7], [p.delta for p in one.params])
+        assert np.allclose(fit.params.best.mean(axis=0), [-2., 3., 0.], atol=.1)
+
+
+class TestCurveFit:
+    def test_linear(self, /) -> None:
+        rng = np.random.default_rng(2)
+        x = np.linspace(0., 5., 20)
+        y = MeasureArray(x*x - 3 + rng.normal(0., .2, 20), .2)
+        fit = curve_fit(lambda x, a, b: a*x*x + b, x, y, p0=[1., 0.])
+        exact = linear_fit(x, y, [lambda x: x*x, lambda x: 1.])
+        assert np.allclose([p.best for p in fit.params], [p.best for p in exact.params])
+        assert np.allclose(fit.cov._np, exact.cov._np, rtol=1e-5)
+        assert np.isclose(fit.chi2.chi2, exact.chi2.chi2)
+        with pytest.raises(ValueError):
+            curve_fit(lambda x, a, b, c: a*x*x + b*x + c, x[:2], y[:2], p0=[1., 0., 0.])
+
+    def test_jac(self, /) -> None:
+        rng = np.random.default_rng(3)
+        t = np.linspace(0., 10., 50)
+        y = MeasureArray(5*np.exp(-t/2) + rng.normal(0., .05, 50), .05)
+        f = lambda t, a, tau: a*np.exp(-t/tau)
+        jac = lambda t, a, tau: (np.exp(-t/tau), a*t/tau**2*np.exp(-t/tau))
+        fd = curve_fit(f, t, y, p0=[1., 1.])
+        an = curve_fit(f, t, y, p0=[1., 1.], jac=jac)
+        assert np.allclose([p.best for p in fd.params], [p.best for p in an.params])
+        assert np.allclose([p.delta for p in fd.params], [p.delta for p in an.params], rtol=1e-4)
+        assert abs(an.params[1].best - 2.) < 3*an.params[1].delta
+        # Models that only accept scalar parameters
+        x = np.linspace(1., 2., 10)
+        scalar = curve_fit(lambda x, a, b: a*math.exp(b)*x + b, x, 3*math.e*x + 1, p0=[1., 0.])
+        assert np.allclose([p.best for p in scalar.params], [3., 1.])
+
+    def test_convergence(self, /) -> None:
+        rng = np.random.default_rng(5)
+        t = np.linspace(0., 10., 50)
+        y = MeasureArray(5*np.exp(-t/2) + rng.normal(0., .05, 50), .05)
+        f = lambda t, a, tau: a*np.exp(-t/tau)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            fit = curve_fit(f, t, y, p0=[1., 1.])
+            # Already at the optimum: no step can improve on it
+            curve_fit(f, t, y, p0=[p.best for p in fit.params])
+        with pytest.warns(ConvergenceWarning):
+            curve_fit(f, t, y, p0=[1., 1.], max_iter=2)
+        with pytest.warns(ConvergenceWarning):
+            # Stuck at the border of the model's domain
+            curve_fit(lambda t, a, tau: np.where(tau < 1., f(t, a, tau), np.nan), t, y, p0=[1., .5])
+
+    def test_bins(self, /) -> None:
+        rng = np.random.default_rng(4)
+        data = ArrayDataSet(np.r_[rng.normal(50., 3., 10**5), rng.uniform(0., 100., 10**5)])
+        bins = data.bins(1000, left=0., right=100.)
+        f = lambda x, n, mu, s, b: n*np.exp(-(x - mu)**2/(2*s*s)) + b
+        gauss = curve_fit(f, bins, p0=[10., 48., 1., 1.])
+        poisson = curve_fit(f, bins, p0=[10., 48., 1., 1.], weights="poisson")
+        for fit in (gauss, poisson):
+            n, mu, s, b = fit.params
+            assert abs(mu.best - 50.) < 4*mu.delta and abs(abs(s.best) - 3.) < 4*s.delta
+            assert fit.chi2.ndf == 996
+        # Only the Poisson likelihood is unbiased on the (low) background counts
+        b = poisson.params[3]
+        assert abs(b.best - 100.) < 4*b.delta
+        assert gauss.params[3].best < b.best
+        with pytest.raises(TypeError):
+            curve_fit(f, np.arange(3.), p0=[1., 1., 1., 1.])
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.dataset"""
+from collections.abc import Sequence
+from math import isclose
+import numpy as np
+import pytest
+from rberga06.phylab.data import MapView, SliceView
+from rberga06.phylab.dataset import ArrayDataSet, DataSet
+from rberga06.phylab.measure import Datum
+from rberga06.phylab.poisson import Poisson
+from rberga06.phylab.range import R
+
+
+class CountingSequence(Sequence[float]):
+    def __init__(self, data: list[float], /) -> None:
+        self.data = data
+        self.passes = 0
+
+    def __len__(self, /) -> int:
+        return len(self.data)
+
+    def __getitem__(self, i, /):  # type: ignore
+        return self.data[i]
+
+    def __iter__(self, /):  # type: ignore
+        self.passes += 1
+        return iter(self.data)
+
+
+class TestDataSet:
+    def test_cache(self, /) -> None:
+        data = CountingSequence([3., 1., 4., 1., 5., 9., 2., 6.])
+        ds = DataSet(data)
+        assert not hasattr(ds, "__dict__") or not ds.__dict__
+        assert ds.sigma_avg == ds.delta
+        assert (ds.n, ds.sum, ds.min, ds.max) == (8, 31., 1., 9.)
+        assert isclose(ds.variance, sum([x**2 for x in data.data])/8 - (31/8)**2)
+        assert data.passes == 1
+        assert DataSet(data) == ds
+
+    def test_views(self, /) -> None:
+        data = CountingSequence([3., 1., 4., 1., 5., 9., 2., 6.])
+        ds = DataSet(data)
+        sliced = ds[1:7:2]
+        assert isinstance(sliced.data, SliceView) and sliced.data.base is data
+        assert list(sliced) == [1., 1., 9.] and list(sliced[1:]) == [1., 9.]
+        mapped = ds.map(lambda x: x * 2).map(lambda x: x + 1)[2:]
+        assert isinstance(mapped.data, MapView) and mapped.data.base.base is data  # type: ignore
+        assert data.passes == 0
+        assert list(mapped) == [9., 3., 11., 19., 5., 13.] and mapped.sum == 60.
+        # Views compare (and hash) like tuples
+        assert mapped == DataSet((9., 3., 11., 19., 5., 13.)) and sliced == DataSet((1., 1., 9.))
+        assert hash(sliced) == hash(DataSet((1., 1., 9.))) and repr(sliced.data) == "SliceView((1.0, 1.0, 9.0))"
+        # `f` is applied once per element
+        calls: list[float] = []
+        doubled = ds.map(lambda x: calls.append(x) or 2*x)
+        assert list(doubled) == list(doubled) and doubled[0] == 6. and doubled.average == 7.75
+        assert len(calls) == 8
+
+    def test_window(self, /) -> None:
+        ds = DataSet([3., 1., 4., 1., 5., 9., 2., 6.])
+        # Points are kept in their original order
+        assert tuple(ds[R["(1;5]"]].data) == (3., 4., 5., 2.)
+        assert tuple(ds[R[:2] | R["(5;)"]].data) == (1., 1., 9., 2., 6.)
+        assert ArrayDataSet(ds.bests)[R[:2] | R["(5;)"]].bests.tolist() == [1., 1., 9., 2., 6.]
+        assert not ds[R["(9;)"]].data and ds.order is ds.order
+        q = [0., .3, .5, 1.]
+        assert np.allclose(ds.quantile(q), np.quantile(ds.bests, q)) and ds.quantile(.5) == 3.5
+        for q in (-.1, 1.5, [.5, 2.], np.nan):
+            with pytest.raises(ValueError):
+                ds.quantile(q)
+
+
+class TestArrayDataSet:
+    def test_stats(self, /) -> None:
+        data = [1., 2., 2., 3., 7.5, -1.]
+        ds, ads = DataSet(data), ArrayDataSet(data)
+        assert ads.n == ds.n == len(ads)
+        assert isclose(ads.sum, ds.sum)
+        assert isclose(ads.average, ds.average)
+        assert isclose(ads.variance, ds.variance)
+        assert isclose(ads.sigma_avg, ds.sigma_avg)
+        assert ads.min.best == ds.min and ads.max.best == ds.max
+        assert isclose(ads.best, ds.best) and isclose(ads.delta, ds.delta)
+
+    def test_of(self, /) -> None:
+        ads = ArrayDataSet.of([Datum(1., .1), 2., Datum(3., .3)])
+        assert ads.bests.dtype == np.float64 and ads.bests.flags.c_contiguous
+        assert ads.deltas.tolist() == [.1, 0., .3]
+        assert ads[2] == Datum(3., .3)
+        assert ads.data == (Datum(1., .1), Datum(2., 0.), Datum(3., .3))
+
+    def test_sequence(self, /) -> None:
+        ads = ArrayDataSet(np.arange(10.), .5)
+        view = ads[2:5]
+        assert isinstance(view, ArrayDataSet) and view.n == 3
+        assert np.shares_memory(view.bests, ads.bests)
+        assert ads[ads.bests > 6].bests.tolist() == [7., 8., 9.]
+        assert ads[R["(6;8]"]].bests.tolist() == [7., 8.]
+        assert ads.map(lambda x: x * 2).bests.tolist() == [*range(0, 20, 2)]
+        assert ads.map(lambda x: x * 2).deltas.tolist() == [1.] * 10
+
+    def test_intbins(self, /) -> None:
+        data = [0]*12+[1]*10+[2]*7+[3]*5+[4]*1
+        bins = ArrayDataSet(data).intbins()
+        assert [b.n for b in bins.bins] == [12, 10, 7, 5, 1]
+        assert Poisson.fit(bins).dist.average == DataSet(data).intbins().average
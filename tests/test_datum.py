@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Tests for rberga06.phylab.measure"""
-from rberga06.phylab.measure import Measure, Datum
+from collections.abc import Sequence
+from math import isclose
+import numpy as np
+from rberga06.phylab.measure import Measure, Datum, MeasureArray
 
 EQ_THRESHOLD = 1e-20
 
@@ -34,3 +37,38 @@ class TestDatum:
         assert Datum(.05,.1).ε(0) == .5
         assert Datum(.1,.1).ε(0) == 1
         assert Datum(.2,.1).ε(0) == 2
+
+
+class TestMeasureArray:
+    def eq(self, x: MeasureArray, y: Sequence[Measure[float]], /) -> None:
+        assert len(x) == len(y)
+        for a, b in zip(x, y):
+            assert isclose(a.best, b.best) and isclose(a.delta, b.delta)
+
+    def test_ops(self, /) -> None:
+        xs = [Datum(3., 1.), Datum(-5., 2.), Datum.from_delta_rel(2., .1)]
+        a = MeasureArray.of(xs)
+        d = Datum(4., .5)
+        assert isinstance(d + a, MeasureArray)
+        for res, ref in [
+            (-a, [-x for x in xs]),
+            (a + d, [x + d for x in xs]),
+            (d - a, [d - x for x in xs]),
+            (a * d, [x * d for x in xs]),
+            (d * a, [d * x for x in xs]),
+            (a / d, [x / d for x in xs]),
+            (d / a, [d / x for x in xs]),
+            (2 / a, [2 / x for x in xs]),
+            (a * -2, [x * -2 for x in xs]),
+            (a ** 3, [x ** 3 for x in xs]),
+            (a * a, [x * x for x in xs]),
+            (1 - a / 2, [1 - x / 2 for x in xs]),
+        ]:
+            self.eq(res, ref)
+        assert a.ε(d).tolist() == [x.ε(d) for x in xs]
+
+    def test_broadcast(self, /) -> None:
+        a = MeasureArray(np.arange(1., 4.), .1)
+        self.eq(a * np.array([1., 2., 3.]), [Datum(1., .1), Datum(4., .2), Datum(9., .3)])
+        self.eq(np.array([1., 2., 3.]) + a, [Datum(2., .1), Datum(4., .1), Datum(6., .1)])
+        assert a[1] == Datum(2., .1) and len(a[1:]) == 2
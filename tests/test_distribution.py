@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.distribution"""
+from math import isclose
+from typing import Any
+import numpy as np
+import pytest
+from rberga06.phylab._numerics import chi2_sf
+from rberga06.phylab.bernoulli import Bernoulli
+from rberga06.phylab.dataset import ArrayDataSet
+from rberga06.phylab.distribution import DistributionFit, chauvenet_filter, chi2_scan, chi2_test
+from rberga06.phylab.normal import Gaussian
+from rberga06.phylab.poisson import Poisson
+
+
+class TestChiSquare:
+    def test_chi2_test(self, /) -> None:
+        res = chi2_test([10, 20, 30], [12., 18., 30.])
+        assert isclose(res.chi2, 4/12 + 4/18) and res.ndf == 2
+        assert isclose(res.p, np.exp(-res.chi2/2))  # for ndf = 2
+        # Merging low-expectation bins: [1+3, 9, 2+1] vs [1+2, 10, 3+1]
+        res = chi2_test([1, 3, 9, 2, 1], [1., 2., 10., 3., 1.], min_expected=3, nparams=1)
+        assert isclose(res.chi2, 1/3 + 1/10 + 1/4) and res.ndf == 1
+        # Batch mode
+        batch = chi2_test([10, 20, 30], [[12., 18., 30.], [10., 20., 30.]])
+        assert np.allclose(batch.chi2, [4/12 + 4/18, 0.]) and batch.ndf.tolist() == [2, 2]
+
+    def test_fit(self, /) -> None:
+        data = Poisson(0, 4.).sample(10_000, seed=1)
+        fit = Poisson.fit(data.intbins())
+        res = fit.chi2()
+        assert 0 < res.ndf < fit.data.nbins - 1 and res.p > 1e-3
+        wrong = Poisson.fit(Gaussian(0, 4., 2.).sample(10_000, seed=1).map(lambda x: round(x.best)).intbins())
+        assert wrong.chi2().p < 1e-6
+
+    def test_scan(self, /) -> None:
+        data = ArrayDataSet(Gaussian(0, 1., 1.).sample(5_000, seed=2).bests).bins(30)
+        µs = np.linspace(.5, 1.5, 101)
+        scan = chi2_scan(data, [Gaussian(data.n, µ, 1.) for µ in µs])
+        assert scan.chi2.shape == (101,)
+        assert abs(µs[np.argmin(scan.chi2)] - 1.) < .05
+        fit = Gaussian.fit(data)
+        assert isclose(scan.chi2[50], chi2_test(data.counts, Gaussian(data.n, 1., 1.).expected_counts(data.edges)).chi2)
+        assert fit.chi2().ndf == scan.ndf[0]
+        # Discrete candidates: all the CDFs are computed from a single table
+        data = Poisson(0, 4.).sample(2_000, seed=5).intbins()
+        for dists in [Poisson(data.n, λ) for λ in (3., 4., 5.)], [Bernoulli(data.n, 20, p) for p in (.15, .2, .25)]:
+            scan = chi2_scan(data, dists)
+            assert np.allclose(scan.chi2, [DistributionFit(d, data).chi2().chi2 for d in dists])
+        assert np.argmin(scan.chi2) == 1
+
+    def test_sparse(self, /) -> None:
+        # A sparse IntBinSet gives the same test as a dense one...
+        data = Poisson(0, 4.).sample(2_000, seed=6)
+        dense, sparse = data.intbins(), data.intbins(sparse=True)
+        dist = Poisson(data.n, 4.)
+        assert isclose(DistributionFit(dist, sparse).chi2().chi2, DistributionFit(dist, dense).chi2().chi2)
+        # ... without allocating a bin for each value in the gaps
+        far = ArrayDataSet(np.r_[np.zeros(50), np.full(50, 1e12)]).intbins(sparse=True)
+        dist = Gaussian(100, 0., 1.)
+        expected = dist.expected_counts([-.5, .5, 1e12 - .5, 1e12 + .5])
+        assert DistributionFit(dist, far).chi2().chi2 == chi2_test([50, 0, 50], expected).chi2
+
+    def test_chi2_sf(self, /) -> None:
+        assert np.allclose(chi2_sf([0., 1., 3.84145882, 6.63489660], 1), [1., .31731050786, .05, .01])
+        assert np.allclose(chi2_sf(np.arange(1., 6.), 2), np.exp(-np.arange(1., 6.)/2))
+        ndf = np.array([10., 100., 1000., 10_000.])
+        assert np.allclose(chi2_sf(ndf, ndf), [.44049328507, .48119168453, .49405285383, .49811936597], rtol=1e-9)
+        assert np.isnan(chi2_sf(1., 0.)) and chi2_sf(np.inf, 3.) == 0.
+
+
+class TestChauvenet:
+    def test_p_worse(self, /) -> None:
+        g = Gaussian(10, 0., 1.)
+        assert np.allclose(g.p_worse([0., 1., -2.]), [1., .31731050786, .04550026389])
+        d = Poisson(10, 3.)
+        assert isclose(d.p_worse(3), 1.)
+        assert isclose(d.p_worse(5), d.p(-np.inf, 1) + d.p(5, np.inf))
+        assert np.allclose(d.p_worse(np.array([1, 5])), d.p_worse(5))
+        assert d.chauvenet(30) and not d.chauvenet(4)
+
+    def test_filter(self, /) -> None:
+        x = Gaussian(0, 10., 1.).sample(1000, seed=3).bests.copy()
+        x[[5, 500, 900]] = [100., -50., 17.]
+        fit, rejected = chauvenet_filter(Gaussian, ArrayDataSet(x))
+        assert rejected[[5, 500, 900]].all()
+        assert fit.data.n == 1000 - rejected.sum()
+        assert abs(fit.dist.µ - 10.) < .1 and abs(fit.dist.s - 1.) < .1
+        # Nothing left to reject on the cleaned data
+        assert not chauvenet_filter(Gaussian, fit.data)[1].any()
+        data = Poisson(0, 3.).sample(200, seed=4)
+        fit, rejected = chauvenet_filter(Poisson, ArrayDataSet([*data.bests, 40.]))
+        assert rejected[-1] and abs(fit.dist.average - 3.) < .5
+
+    def test_filter_empty(self, /) -> None:
+        class RejectAll:
+            @classmethod
+            def fit(cls, data: ArrayDataSet) -> DistributionFit[Any, ArrayDataSet]:
+                return DistributionFit(cls(), data)
+
+            def chauvenet(self, x: Any) -> Any:
+                return np.ones(np.shape(x), dtype=np.bool_)
+
+        with pytest.raises(ValueError):
+            chauvenet_filter(RejectAll, ArrayDataSet([1., 2., 3.]))  # type: ignore
+        with pytest.raises(ValueError):
+            chauvenet_filter(Gaussian, ArrayDataSet([]))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.dual"""
+from math import cos, hypot, isclose, log, sin
+import numpy as np
+from rberga06.phylab import dual
+from rberga06.phylab.dual import Dual, propagate
+from rberga06.phylab.measure import Datum, MeasureArray
+
+
+class TestDual:
+    def test_partials(self, /) -> None:
+        x, y = Dual.variable(2., 0), Dual.variable(3., 1)
+        z = x*y + dual.sin(x) / y - 1
+        assert isclose(z.value, 5 + sin(2)/3)
+        assert isclose(z.partials[0], 3 + cos(2)/3)
+        assert isclose(z.partials[1], 2 - sin(2)/9)
+        assert np.allclose(z.gradient(3), [3 + cos(2)/3, 2 - sin(2)/9, 0.])
+        w = x ** y
+        assert isclose(w.partials[0], 3*4) and isclose(w.partials[1], 8*log(2))
+        assert (2 ** x).partials[0] == 4*log(2)
+        assert set((x + 1).partials) == {0}
+
+    def test_functions(self, /) -> None:
+        assert dual.exp(0.) == 1. and dual.sqrt(4.) == 2.
+        x = Dual.variable(.5, 0)
+        for f, df in [(dual.log, 2.), (dual.sqrt, 1/(2*.5**.5)), (dual.tanh, 1 - np.tanh(.5)**2)]:
+            assert isclose(f(x).partials[0], df)
+
+
+class TestPropagate:
+    def test_scalar(self, /) -> None:
+        x, y = Datum(2., .1), Datum(3., .2)
+        z = propagate(lambda x, y: x**y, x, y)
+        assert isinstance(z, Datum) and z.best == 8.
+        assert isclose(z.delta, 8*hypot(3/2*.1, log(2)*.2))
+        z = propagate(lambda x, y: x**y, x, y, use_delta_upper_bound=True)
+        assert isclose(z.delta, 8*(3/2*.1 + log(2)*.2))
+        # Correlations are handled exactly
+        assert propagate(lambda x: x - x, x) == Datum(0., 0.)
+        assert propagate(lambda x: x if x > 0 else -x, Datum(-1., .5)) == Datum(1., .5)
+
+    def test_array(self, /) -> None:
+        z = propagate(lambda x, y: 2*x**2 + y, MeasureArray([1., 2.], .1), Datum(1., .3))
+        assert isinstance(z, MeasureArray)
+        assert np.allclose(z.best, [3., 9.]) and np.allclose(z.delta, [.5, np.hypot(.8, .3)])
+        # Arrays on the left
+        z = propagate(lambda x: np.array([1., 2., 3.]) * x, Datum(2., .1))
+        assert isinstance(z, MeasureArray)
+        assert np.allclose(z.best, [2., 4., 6.]) and np.allclose(z.delta, [.1, .2, .3])
+        z = propagate(lambda x: np.array([1., 2.]) - x, Datum(2., .1))
+        assert isinstance(z, MeasureArray) and np.allclose(z.best, [-1., 0.]) and np.allclose(z.delta, .1)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.graph"""
+from math import isclose
+import numpy as np
+from rberga06.phylab import constants
+from rberga06.phylab.graph import Graph, fuse
+from rberga06.phylab.measure import Datum, MeasureArray
+
+
+def _f(x, y, z):  # pyright: ignore
+    return ((x*y + z)/(x - y) + x**2 * z - y/z) * (x + y + z) / (x*y*z) - 3*x
+
+
+class TestGraph:
+    def test_cse(self, /) -> None:
+        g = Graph()
+        x, y = g.var("x"), g.var("y")
+        a = x*y + y*x
+        assert len(g.nodes) == 4
+        out = a.eval(x=Datum(2., .1), y=Datum(3., .2))
+        assert out.best == 12. and isclose(out.delta, (Datum(2., .1)*Datum(3., .2)*2).delta)
+        p = g.compile(a - x*2, x + 1)
+        assert p.inputs == ("x", "y")
+        assert p(Datum(2., .1), y=Datum(3., .2))[1] == Datum(3., .1)
+
+    def test_fuse(self, /) -> None:
+        f = fuse(_f)
+        xyz = Datum(2., .1), Datum(3., .2), Datum(5., .3)
+        out, expected = f(*xyz), _f(*xyz)
+        assert isclose(out.best, expected.best) and isclose(out.delta, expected.delta)
+        mass = fuse(lambda N, Z: Z*(constants.M_proton + constants.M_electron) + (N - Z)*constants.M_neutron)
+        assert mass(232, 90) == constants.Th232.mass
+
+    def test_constants(self, /) -> None:
+        # Constants whose `repr` is not valid code
+        assert fuse(lambda x: x*np.arange(3.)[2])(Datum(1., .1)) == Datum(2., .2)
+        assert fuse(lambda x: x**np.float64(2.))(Datum(3., .1)).best == 9.
+        assert fuse(lambda x: x + float("inf"))(Datum(1., .1)).best == float("inf")
+
+    def test_array(self, /) -> None:
+        f = fuse(_f)
+        x = MeasureArray([2., 4.], .1)
+        out = f(x, Datum(3., .2), 5.)
+        assert isinstance(out, MeasureArray)
+        assert np.allclose(out.best, [_f(2., 3., 5.), _f(4., 3., 5.)])
+        assert isclose(out.delta[1], _f(x[1], Datum(3., .2), 5.).delta)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.normal"""
+from math import erf, exp, isclose, pi, sqrt
+import numpy as np
+from rberga06.phylab.dataset import ArrayDataSet
+from rberga06.phylab.distribution import spawn
+from rberga06.phylab.normal import Gaussian
+
+
+class TestGaussian:
+    def test_pdf(self, /) -> None:
+        g = Gaussian(100, 1., 2.)
+        xs = np.linspace(-5., 5., 11)
+        ref = [exp(-((x - 1.)/2.)**2/2)/(sqrt(2*pi)*2.) for x in xs.tolist()]
+        assert np.allclose(g.pdf(xs), ref)
+        assert isinstance(g.pdf(0.), float) and isclose(g.pdf(0.), ref[5])
+
+    def test_cdf(self, /) -> None:
+        g = Gaussian(100, 1., 2.)
+        assert g.cdf(1.) == .5 and g.cdf(-np.inf) == 0 and g.cdf(np.inf) == 1
+        assert isclose(g.p(-1., 3.), erf(1/sqrt(2)))
+        assert isclose(g.p(-np.inf, np.inf), 1)
+        edges = np.linspace(-3., 5., 9)
+        counts = g.expected_counts(edges)
+        assert np.allclose(counts, [g.expected(a, b) for a, b in zip(edges[:-1], edges[1:])])
+        assert g.bins(8, -3., 5.) == tuple(counts.tolist())
+        xs = np.linspace(-20., 20., 4001)
+        assert np.allclose(g.cdf(xs), [(1 + erf((x - 1.)/(2*sqrt(2))))/2 for x in xs.tolist()], rtol=1e-15, atol=1e-16)
+
+    def test_sample(self, /) -> None:
+        g = Gaussian(100, 1., 2.)
+        ds = g.sample(100_000, seed=42)
+        assert isinstance(ds, ArrayDataSet) and ds.n == 100_000
+        assert abs(ds.average - 1.) < 5*ds.sigma_avg and abs(ds.sigma - 2.) < .05
+        assert np.array_equal(g.sample(10, seed=42).bests, ds.bests[:10])
+        s1, s2 = spawn(42, 2)
+        assert not np.array_equal(g.sample(10, seed=s1).bests, g.sample(10, seed=s2).bests)
+        assert np.array_equal(g.sample(10, seed=spawn(42, 2)[1]).bests, g.sample(10, seed=s2).bests)
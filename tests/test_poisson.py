@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Tests for rberga06.phylab.poisson"""
+from math import exp, factorial, inf as oo, isclose, lgamma, log
 from random import shuffle
+import numpy as np
 from rberga06.phylab.dataset import DataSet
 from rberga06.phylab.poisson import Poisson
 
@@ -16,3 +18,35 @@ class TestPoisson:
         fit = Poisson.fit(bins)
         assert fit.data.orig.data is data
         assert fit.dist.average == fit.data.average
+
+    def test_p(self, /) -> None:
+        d = Poisson(100, 2.5)
+        assert isclose(d.p(-np.inf, np.inf), 1)
+        assert isclose(d.p(1, 3), d.pdf(1) + d.pdf(2) + d.pdf(3))
+        assert isclose(d.p(.5, 3.7), d.p(1, 3)) and d.cdf(-.5) == 0
+        assert np.allclose(d.pdf(np.arange(4)), [exp(-2.5) * 2.5**k/factorial(k) for k in range(4)])
+        assert np.allclose(d.intbins(0, 3), [d.expected(k, k) for k in range(4)])
+
+    def test_large(self, /) -> None:
+        d = Poisson(100, 5000.)
+        assert isclose(d.logpdf(5000), -5.1775, abs_tol=1e-4)  # log(1/sqrt(2π⋅5000))
+        assert isclose(d.p(-np.inf, 5000) + d.p(5001, np.inf), 1)
+        assert -oo < d.logpdf(10**6) < d.logpdf(8000) < d.logpdf(5000)
+        ks = np.arange(0, 10**7, 9973)
+        ref = [k*log(5000.) - 5000. - lgamma(k + 1) for k in ks.tolist()]
+        assert np.allclose(d.logpdf(ks), ref, rtol=1e-14)
+
+    def test_tails(self, /) -> None:
+        d = Poisson(100, 3.)
+        assert d.chauvenet(np.array([1, 3, 4e7])).tolist() == [False, False, True]
+        assert d.p(0, 5e6) == 1. and d.p_worse(5e6) == 0. and d.cdf(4e7) == 1.
+        assert d.pdf_table(oo).size < 1000  # the table stops where the PDF underflows
+        # The upper tail is computed directly, without cancellation
+        assert isclose(d.sf(40), sum(exp(-3.) * 3.**k/factorial(k) for k in range(41, 150)), rel_tol=1e-12)
+        assert np.allclose(d.sf(np.arange(-1, 10)), 1 - d.cdf(np.arange(-1, 10)))
+        assert isclose(d.p_worse(40), d.cdf(-34) + d.sf(39))
+
+    def test_sample(self, /) -> None:
+        ds = Poisson(100, 3.).sample(10_000, seed=0)
+        fit = Poisson.fit(ds.intbins())
+        assert abs(fit.dist.average - 3.) < 5*ds.sigma_avg
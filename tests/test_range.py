@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Tests for rberga06.phylab.range"""
-from rberga06.phylab.range import R, Range
+import random
+import numpy as np
+import pytest
+from rberga06.phylab.range import R, Range, RangeSet
 
 class TestRange:
     def test_mk(self, /) -> None:
@@ -29,3 +32,80 @@ class TestRange:
         assert 0 not in R["[-1;0)"]
         assert 0 in R["[0;+1)"]
         assert 0 in R["(-1;0]"]
+        assert not R["(0;0]"] and not R["[0;0)"] and not R["(0;0)"] and R["[0]"]
+
+    def test_mask(self, /) -> None:
+        x = np.array([-1., 0., .5, 1., 2.])
+        for r in [R["(0;1]"], R["[0;1)"], R[0:], R[:1], R, R["[1]"]]:
+            assert r.mask(x).tolist() == [v in r for v in x.tolist()]
+
+    def test_edges(self, /) -> None:
+        assert R[0:1].edges(4).tolist() == [0., .25, .5, .75, 1.]
+        with pytest.raises(ValueError):
+            R[0:].edges(3)
+
+    def test_star_import(self, /) -> None:
+        import rberga06.phylab.range
+        ns: dict[str, object] = {}
+        exec("from rberga06.phylab import *", ns)
+        assert "range" not in ns and "R" in ns
+        assert rberga06.phylab.range.R is R
+
+
+class TestRangeSet:
+    def test_algebra(self, /) -> None:
+        a = R[0:1] | R[5:6]
+        assert a.ranges == (R[0:1], R[5:6]) and 3 not in a
+        assert R[0:1].hull(R[5:6]) == R[0:6]
+        assert (R["[0;1)"] | R["[1;2]"]).ranges == (R[0:2],)
+        assert len(R["[0;1)"] | R["(1;2]"]) == 2
+        assert (a & R[.5:5.5]).ranges == (R[.5:1], R[5:5.5])
+        assert (a - R["(.5;5.5)"]).ranges == (R[0:.5], R[5.5:6])
+        assert (~a).ranges == (R["(;0)"], R["(1;5)"], R["(6;)"])
+        assert not (a & ~a) and R[:] == (a | ~a).ranges[0]
+
+    def test_mask(self, /) -> None:
+        s = R["[0;1)"] | R["(1;2]"] | R["[3]"] | R[:-5] | R["(7;8)"]
+        x = np.array([-6., -5., -4., 0., 1., 2., 2.5, 3., 7., 7.5, 8., 9.])
+        assert s.mask(x).tolist() == [v in s for v in x.tolist()] == [any(v in r for r in s) for v in x.tolist()]
+        assert not RangeSet().mask(x).any()
+
+
+    def test_degenerate(self, /) -> None:
+        for r in [R["(0;0]"], R["[0;0)"], R["(0;0)"], R["(1;0)"]]:
+            assert not RangeSet(r) and (~RangeSet(r)).ranges == (R[:],)
+            assert 0. in ~RangeSet(r) and 0. in R[:] - r
+            assert (R[-1:1] | r).ranges == (R[-1:1],)
+
+    def test_random(self, /) -> None:
+        # Property test against naive membership, with lots of shared/degenerate endpoints
+        rng = random.Random(42)
+        points = np.arange(-1., 5.5, .5)
+
+        def rand_range() -> Range:
+            a, b = sorted(rng.choices(range(5), k=2))
+            return Range(rng.choice("[("), a, b, rng.choice("])"))  # type: ignore
+
+        def rand_set() -> tuple[RangeSet, list[Range]]:
+            rs = [rand_range() for _ in range(rng.randrange(4))]
+            return RangeSet(*rs), rs
+
+        for _ in range(500):
+            (a, ra), (b, rb) = rand_set(), rand_set()
+            ina = [any(x in r for r in ra) for x in points.tolist()]
+            inb = [any(x in r for r in rb) for x in points.tolist()]
+            for s, expected in [
+                (a, ina),
+                (a | b, [p or q for p, q in zip(ina, inb)]),
+                (a & b, [p and q for p, q in zip(ina, inb)]),
+                (a - b, [p and not q for p, q in zip(ina, inb)]),
+                (~a, [not p for p in ina]),
+            ]:
+                assert [x in s for x in points.tolist()] == expected
+                assert s.mask(points).tolist() == expected
+                # Canonical form: sorted, non-empty, disjoint and non-adjacent
+                assert all(s.ranges)
+                assert all(
+                    r.right < q.left or (r.right == q.left and r.pright == ")" and q.pleft == "(")
+                    for r, q in zip(s.ranges, s.ranges[1:])
+                )
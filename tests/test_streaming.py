@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.streaming"""
+from math import isclose
+import numpy as np
+from rberga06.phylab.dataset import ArrayDataSet, DataSet
+from rberga06.phylab.measure import Datum
+from rberga06.phylab.streaming import StreamingStats
+
+
+class TestStreamingStats:
+    def test_push(self, /) -> None:
+        data = [3., 1., 4., 1., 5., 9., 2., 6.]
+        s = StreamingStats()
+        for x in data:
+            s.push(x)
+        ds = DataSet(data)
+        assert s.n == ds.n and (s.min, s.max) == (1., 9.)
+        assert isclose(s.average, ds.average) and isclose(s.variance, ds.variance)
+        assert isclose(s.sigma_avg, ds.sigma_avg)
+
+    def test_merge(self, /) -> None:
+        rng = np.random.default_rng(0)
+        a = rng.normal(5., 2., 1000)
+        parts = [StreamingStats.of(chunk) for chunk in np.array_split(a, 7)]
+        s = StreamingStats().merge(*parts)
+        assert s.n == a.size
+        assert isclose(s.average, a.mean()) and isclose(s.variance, a.var())
+        assert isclose((parts[0] + parts[1]).variance, a[:parts[0].n + parts[1].n].var())
+        assert (parts[0] + parts[1]).n == parts[0].n + parts[1].n != parts[0].n
+        assert StreamingStats.of([Datum(1., .1), 3]).average == 2.
+
+    def test_offset(self, /) -> None:
+        # Timestamps-like data: tiny spread on top of a huge offset
+        a = 1e9 + np.array([4., 7., 13., 16.])
+        assert StreamingStats.of(a).variance == 22.5
+        assert StreamingStats.of(a.tolist()).variance == 22.5
+        assert DataSet(a.tolist()).variance == 22.5
+        assert ArrayDataSet(a).variance == 22.5
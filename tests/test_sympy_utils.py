@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab.sympy_utils"""
+from math import cos, hypot, isclose
+import numpy as np
+import pytest
+
+sympy = pytest.importorskip("sympy")
+
+from rberga06.phylab.measure import MeasureArray  # noqa: E402
+from rberga06.phylab.sympy_utils import compiled, evalf, evalf_batch, symbols  # noqa: E402
+
+
+class TestSympyUtils:
+    def test_evalf(self, /) -> None:
+        x, y = symbols(["x", "y"], [(2., .1), (3., .2)])
+        expr = x*y + sympy.sin(x)
+        delta = hypot((3 + cos(2.))*.1, 2.*.2)
+        for res in evalf(expr), compiled(expr)():
+            assert isclose(res.best, 6 + np.sin(2.)) and isclose(res.delta, delta)
+        assert compiled(expr) is compiled(x*y + sympy.sin(x))
+
+    def test_exact(self, /) -> None:
+        x, = symbols(["x"], [(1., .2)])
+        k = sympy.Symbol("k")
+        for res in evalf(x*k, subs={k: 2.}), compiled(x*k)({k: 2.}):
+            assert isclose(res.best, 2.) and isclose(res.delta, .4)  # (no free `delta[k]` left)
+
+    def test_batch(self, /) -> None:
+        x, y = symbols(["x", "y"], [(2., .1), (3., .2)])
+        xs = MeasureArray(np.linspace(1., 2., 5), .1)
+        res = evalf_batch(x*y + sympy.sin(x), {x: xs})
+        assert isinstance(res, MeasureArray) and res.shape == (5,)
+        assert np.allclose(res.best, xs.best*3 + np.sin(xs.best))
+        assert isclose(res.delta[-1], hypot((3 + cos(2.))*.1, 2.*.2))
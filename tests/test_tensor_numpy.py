@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for rberga06.phylab._tensor_numpy"""
+import numpy as np
+import pytest
+from rberga06.phylab._tensor_numpy import Mat, Simd, Vec
+
+
+class TestVec:
+    def test_dtype(self, /) -> None:
+        assert Vec([1, 2, 3])._np.dtype == np.int64
+        assert Vec(x/2 for x in range(3))._np.dtype == np.float64
+        assert Vec([True, False])._np.dtype == np.bool_
+        a = np.arange(3.)
+        v = Vec(a, 3)
+        assert not np.shares_memory(v._np, a) and (v + 1)._np.dtype == np.float64
+        a[0] = 7.
+        assert v._np[0] == 0.
+        assert list(v * 2 - 1) == [-1., 1., 3.] and v @ v == 5.
+
+
+class TestMat:
+    def test_ops(self, /) -> None:
+        m = Mat([[2., 1.], [1., 3.]], 2, 2)
+        assert m._np.dtype == np.float64 and Mat([Vec([1, 2]), (3, 4)])._np.dtype == np.int64
+        assert np.allclose((m @ m.inv())._np, np.eye(2))
+        assert np.isclose(m.det(), 5.) and m.rk() == 2 and m.T.shape == (2, 2)
+        assert list(m @ Vec([1., 1.])) == [3., 4.] and list(Vec([1., 1.]) @ m) == [3., 4.]
+        assert np.shares_memory(m.T._np, m._np)
+        a = np.eye(2)
+        e = Mat(a)
+        a[0, 0] = 7.
+        assert e._np[0, 0] == 1. and not np.shares_memory(Simd.from_it(a)._np, a)
+
+
+class TestSimd:
+    def test_linalg(self, /) -> None:
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=(1000, 3, 3))
+        m = Simd.from_it(a).as_simd_mat
+        assert m.shape == (1000,)
+        assert np.allclose((m @ m.mat_inv())._np, np.eye(3))
+        assert np.allclose(m.mat_det()._np, np.linalg.det(a))
+        assert (m.mat_rk()._np == 3).all() and np.allclose(m.mat_T._np[7], a[7].T)
+        v = Vec([1., 2., 3.])
+        assert np.allclose((m @ v)._np[5], a[5] @ v._np) and np.allclose((v @ m)._np[5], v._np @ a[5])
+        assert np.allclose((m @ v @ v)._np, a @ v._np @ v._np)
+        assert np.allclose((Mat(np.eye(3)) @ m + 1)._np, a + 1)
+
+    def test_reshape(self, /) -> None:
+        s = Simd.from_it([Mat([[1., 2.], [3., 4.]]), Mat([[0., 1.], [1., 0.]])])
+        assert s.shape == (2,) and s.simd_map(lambda m: m.det())._np.tolist() == s.mat_det()._np.tolist()
+        joined = s.simd_map(lambda m: m.into_simd).simd_join
+        assert joined.shape == (2, 2, 2) and joined._np[1].tolist() == [[0., 1.], [1., 0.]]
+        x = Simd.from_it(np.arange(6.))
+        assert list((x * 2 + 1).as_vector) == [1., 3., 5., 7., 9., 11.]
+        assert Simd.from_it(np.arange(6.).reshape(2, 3)).as_simd_vec.shape == (2,)
+        assert Mat([[1, 2], [3, 4]]).into_simd.as_matrix._np.tolist() == [[1, 2], [3, 4]]
+        assert np.allclose((s * s.mat_det())._np[0], [[-2., -4.], [-6., -8.]])
+
+    def test_promotion(self, /) -> None:
+        s = Simd.from_it([Mat([[1., 2.], [3., 4.]]), Mat([[0., 1.], [1., 0.]])])
+        d = s.mat_det()
+        # A Simd of scalars broadcasts over the elements, on either side
+        for p in s * d, d * s:
+            assert p._kind == 2 and np.allclose(p._np, s._np * d._np[:, None, None])
+        assert np.allclose((d - s)._np, d._np[:, None, None] - s._np)
+        assert np.allclose((s - d)._np, s._np - d._np[:, None, None])
+        assert np.allclose((d / (s + 1))._np, d._np[:, None, None] / (s._np + 1))
+        # Vec/Mat operands apply to every element
+        x = Simd.from_it(np.arange(3.))
+        v = Vec([1., 2., 3.])
+        for p in x + v, v + x:
+            assert p._kind == 1 and p.shape == (3,) and np.allclose(p._np, np.arange(3.)[:, None] + v._np)
+        assert np.allclose((v - x)._np, v._np - np.arange(3.)[:, None])
+        assert np.allclose((x - v)._np, np.arange(3.)[:, None] - v._np)
+        m = Mat([[1., 0.], [0., 1.]])
+        for p in s + m, m + s:
+            assert p._kind == 2 and np.allclose(p._np, s._np + np.eye(2))
+        with pytest.raises(TypeError):
+            s + v
+        with pytest.raises(TypeError):
+            v * s
+        with pytest.raises(TypeError):
+            Simd.from_it([v, v]) * s
+
+
+class TestMatFunctions:
+    def test_exp_log(self, /) -> None:
+        assert np.allclose(Mat([[0., 1.], [0., 0.]]).mat_exp()._np, [[1., 1.], [0., 1.]])
+        rot = Mat([[0., -np.pi/2], [np.pi/2, 0.]]).mat_exp()._np
+        assert np.allclose(rot, [[0., -1.], [1., 0.]])
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=(4, 4))
+        spd = Mat(a @ a.T + np.eye(4))
+        assert np.allclose(spd.mat_log().mat_exp()._np, spd._np)
+        big = Mat(a * 10).mat_exp()
+        assert np.allclose(big.mat_log().mat_exp()._np, big._np, rtol=1e-9)
+        with pytest.raises(ValueError):
+            Mat([[-1., 0.], [0., 1.]]).mat_log()
+
+    def test_batched(self, /) -> None:
+        rng = np.random.default_rng(1)
+        a = rng.normal(size=(50, 3, 3))
+        m = Simd.from_it(a).as_simd_mat
+        e = m.mat_exp()
+        assert np.allclose(e._np[17], Mat(a[17]).mat_exp()._np)
+        assert np.allclose(e.mat_log().mat_exp()._np, e._np)
+
+    def test_grid(self, /) -> None:
+        # A two-step decay chain: A -> B -> (stable)
+        k = Mat([[-1., 0.], [1., -.1]])
+        ts = Vec(np.linspace(0., 10., 101))
+        g = k.mat_exp_grid(ts)
+        assert g.shape == (101,)
+        assert np.allclose(g._np[50], Mat(k._np * 5.).mat_exp()._np)
+        nb = (g @ Vec([1., 0.]))._np[:, 1]
+        t = ts._np
+        assert np.allclose(nb, (np.exp(-.1*t) - np.exp(-t))/.9)
+        # Not diagonalizable
+        assert np.allclose(Mat([[0., 1.], [0., 0.]]).mat_exp_grid(Vec([2.]))._np[0], [[1., 2.], [0., 1.]])
+        # Nearly defective: the eigenvectors are ill-conditioned
+        near = Mat([[1., 1.], [0., 1. + 1e-5]])
+        assert np.allclose(near.mat_exp_grid(Vec([1.]))._np[0], near.mat_exp()._np, rtol=1e-14, atol=0.)